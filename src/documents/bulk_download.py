@@ -1,8 +1,33 @@
 import os
+import shutil
+from pathlib import Path
+from typing import IO
+from typing import Final
+from zipfile import ZIP_STORED
 from zipfile import ZipFile
+from zipfile import ZipInfo
 
 from documents.models import Document
 
+# These formats are compressed already, compressing them again costs CPU time
+# for next to no reduction in size
+PRECOMPRESSED_MIME_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "application/pdf",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+    },
+)
+
+# Suffix of the zip files bulk downloads are written to in the scratch directory
+BULK_DOWNLOAD_SUFFIX: Final[str] = "-compressed-archive"
+
+# ZipFile.write copies in 8 KiB chunks, larger reads cut down the number of
+# Python level copies for large documents
+COPY_BUFFER_SIZE: Final[int] = 1024 * 1024
+
 
 class BulkArchiveStrategy:
     def __init__(self, zipf: ZipFile, follow_formatting: bool = False):
@@ -51,35 +76,84 @@ class BulkArchiveStrategy:
 
         return in_archive_path
 
+    def add_file(self, path: Path, arcname: str, mime_type: str):
+        """
+        Writes the file into the zip file, storing it as is if it is already
+        compressed and using the compression of the zip file otherwise
+        """
+        zinfo = ZipInfo.from_file(path, arcname)
+        zinfo.compress_type = (
+            ZIP_STORED
+            if mime_type in PRECOMPRESSED_MIME_TYPES
+            else self.zipf.compression
+        )
+        with open(path, "rb") as src, self.zipf.open(zinfo, "w") as dest:
+            shutil.copyfileobj(src, dest, COPY_BUFFER_SIZE)
+
     def add_document(self, doc: Document):
         raise NotImplementedError  # pragma: no cover
 
 
 class OriginalsOnlyStrategy(BulkArchiveStrategy):
     def add_document(self, doc: Document):
-        self.zipf.write(doc.source_path, self.make_unique_filename(doc))
+        self.add_file(doc.source_path, self.make_unique_filename(doc), doc.mime_type)
 
 
 class ArchiveOnlyStrategy(BulkArchiveStrategy):
     def add_document(self, doc: Document):
         if doc.has_archive_version:
-            self.zipf.write(
+            self.add_file(
                 doc.archive_path,
                 self.make_unique_filename(doc, archive=True),
+                "application/pdf",
             )
         else:
-            self.zipf.write(doc.source_path, self.make_unique_filename(doc))
+            self.add_file(
+                doc.source_path,
+                self.make_unique_filename(doc),
+                doc.mime_type,
+            )
 
 
 class OriginalAndArchiveStrategy(BulkArchiveStrategy):
     def add_document(self, doc: Document):
         if doc.has_archive_version:
-            self.zipf.write(
+            self.add_file(
                 doc.archive_path,
                 self.make_unique_filename(doc, archive=True, folder="archive/"),
+                "application/pdf",
             )
 
-        self.zipf.write(
+        self.add_file(
             doc.source_path,
             self.make_unique_filename(doc, folder="originals/"),
+            doc.mime_type,
         )
+
+
+def write_bulk_archive(
+    target: Path | IO[bytes],
+    document_ids: list[int],
+    compression: int,
+    content: str,
+    follow_formatting: bool = False,
+) -> None:
+    """
+    Writes the given documents into a new zip file at target, including the
+    originals, the archive versions or both depending on content
+    """
+    if content == "both":
+        strategy_class = OriginalAndArchiveStrategy
+    elif content == "originals":
+        strategy_class = OriginalsOnlyStrategy
+    else:
+        strategy_class = ArchiveOnlyStrategy
+
+    with ZipFile(target, "w", compression) as zipf:
+        strategy = strategy_class(zipf, follow_formatting)
+        for document in (
+            Document.objects.filter(pk__in=document_ids)
+            .select_related("correspondent")
+            .defer("content")
+        ):
+            strategy.add_document(document)
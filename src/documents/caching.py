@@ -1,10 +1,13 @@
 import logging
 from binascii import hexlify
 from dataclasses import dataclass
+from hashlib import sha256
 from typing import TYPE_CHECKING
 from typing import Final
 from typing import Optional
 
+from django.conf import settings
+from django.contrib.auth.models import User
 from django.core.cache import cache
 
 from documents.models import Document
@@ -30,9 +33,17 @@ class SuggestionCacheData:
     suggestions: dict
 
 
+@dataclass(frozen=True)
+class SuggestedDatesCacheData:
+    checksum: str
+    number_of_dates: int
+    dates: list[str]
+
+
 CLASSIFIER_VERSION_KEY: Final[str] = "classifier_version"
 CLASSIFIER_HASH_KEY: Final[str] = "classifier_hash"
 CLASSIFIER_MODIFIED_KEY: Final[str] = "classifier_modified"
+REMOTE_VERSION_KEY: Final[str] = "remote_version"
 
 CACHE_1_MINUTE: Final[int] = 60
 CACHE_5_MINUTES: Final[int] = 5 * CACHE_1_MINUTE
@@ -114,6 +125,54 @@ def refresh_suggestions_cache(
     cache.touch(doc_key, timeout)
 
 
+def get_suggested_dates_cache_key(document_id: int) -> str:
+    """
+    Returns the basic key for a document's suggested dates
+    """
+    return f"doc_{document_id}_suggested_dates"
+
+
+def get_suggested_dates_cache(document: Document) -> list[str] | None:
+    """
+    Returns the cached suggested dates for the given Document.  Dates only depend on
+    the document itself, so unlike the other suggestions they outlive classifier
+    changes, as long as the checksum and the number of dates still match
+    """
+    doc_key = get_suggested_dates_cache_key(document.pk)
+    doc_dates: SuggestedDatesCacheData | None = cache.get(doc_key)
+    if doc_dates is not None:
+        if (
+            doc_dates.checksum == document.checksum
+            and doc_dates.number_of_dates == settings.NUMBER_OF_SUGGESTED_DATES
+        ):
+            cache.touch(doc_key, CACHE_50_MINUTES)
+            return doc_dates.dates
+        else:  # pragma: no cover
+            # Something didn't match, delete the key
+            cache.delete(doc_key)
+    return None
+
+
+def set_suggested_dates_cache(
+    document: Document,
+    dates: list[str],
+    *,
+    timeout=CACHE_50_MINUTES,
+) -> None:
+    """
+    Caches the suggested dates for the given Document
+    """
+    cache.set(
+        get_suggested_dates_cache_key(document.pk),
+        SuggestedDatesCacheData(
+            document.checksum,
+            settings.NUMBER_OF_SUGGESTED_DATES,
+            dates,
+        ),
+        timeout,
+    )
+
+
 def get_metadata_cache_key(document_id: int) -> str:
     """
     Returns the basic key for a document's metadata
@@ -194,6 +253,27 @@ def refresh_metadata_cache(
     cache.touch(doc_key, timeout)
 
 
+def get_autocomplete_cache_key(
+    index_generation: int,
+    user: User | None,
+    term: str,
+    limit: int,
+) -> str:
+    """
+    Returns the key for the autocomplete terms of the given query.  Every write to the
+    index bumps its generation, so cached terms never outlive an index update.
+    Superusers see all documents and share their entries
+    """
+    if user is None:
+        user_key = "anonymous"
+    elif user.is_superuser:
+        user_key = "superuser"
+    else:
+        user_key = f"user_{user.id}"
+    term_hash = sha256(term.encode()).hexdigest()
+    return f"autocomplete_{index_generation}_{user_key}_{limit}_{term_hash}"
+
+
 def get_thumbnail_modified_key(document_id: int) -> str:
     """
     Builds the key to store a thumbnail's timestamp
@@ -201,6 +281,13 @@ def get_thumbnail_modified_key(document_id: int) -> str:
     return f"doc_{document_id}_thumbnail_modified"
 
 
+def get_bulk_download_cache_key(task_id: str) -> str:
+    """
+    Returns the key storing the owner of a bulk download built in the background
+    """
+    return f"bulk_download_{task_id}"
+
+
 def clear_document_caches(document_id: int) -> None:
     """
     Removes all cached items for the given document
@@ -208,6 +295,7 @@ def clear_document_caches(document_id: int) -> None:
     cache.delete_many(
         [
             get_suggestion_cache_key(document_id),
+            get_suggested_dates_cache_key(document_id),
             get_metadata_cache_key(document_id),
             get_thumbnail_modified_key(document_id),
         ],
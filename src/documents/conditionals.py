@@ -12,6 +12,7 @@ from documents.caching import CLASSIFIER_VERSION_KEY
 from documents.caching import get_thumbnail_modified_key
 from documents.classifier import DocumentClassifier
 from documents.models import Document
+from documents.utils import get_boolean_query_param
 
 
 def suggestions_etag(request, pk: int) -> str | None:
@@ -99,10 +100,7 @@ def preview_etag(request, pk: int) -> str | None:
     """
     try:
         doc = Document.objects.only("checksum", "archive_checksum").get(pk=pk)
-        use_original = (
-            "original" in request.query_params
-            and request.query_params["original"] == "true"
-        )
+        use_original = get_boolean_query_param(request, "original")
         return doc.checksum if use_original else doc.archive_checksum
     except Document.DoesNotExist:  # pragma: no cover
         return None
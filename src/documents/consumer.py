@@ -46,6 +46,7 @@ from documents.signals.handlers import run_workflows
 from documents.templating.title import parse_doc_title_w_placeholders
 from documents.utils import copy_basic_file_stats
 from documents.utils import copy_file_with_basic_stats
+from documents.utils import detect_language
 from documents.utils import run_subprocess
 
 
@@ -166,14 +167,18 @@ class ConsumerPlugin(
         """
         with open(self.input_doc.original_file, "rb") as f:
             checksum = hashlib.md5(f.read()).hexdigest()
-        existing_doc = Document.global_objects.filter(
-            Q(checksum=checksum) | Q(archive_checksum=checksum),
+        existing_doc = (
+            Document.global_objects.filter(
+                Q(checksum=checksum) | Q(archive_checksum=checksum),
+            )
+            .only("pk", "title", "deleted_at")
+            .first()
         )
-        if existing_doc.exists():
+        if existing_doc is not None:
             msg = ConsumerStatusShortMessage.DOCUMENT_ALREADY_EXISTS
-            log_msg = f"Not consuming {self.filename}: It is a duplicate of {existing_doc.get().title} (#{existing_doc.get().pk})."
+            log_msg = f"Not consuming {self.filename}: It is a duplicate of {existing_doc.title} (#{existing_doc.pk})."
 
-            if existing_doc.first().deleted_at is not None:
+            if existing_doc.deleted_at is not None:
                 msg = ConsumerStatusShortMessage.DOCUMENT_ALREADY_EXISTS_IN_TRASH
                 log_msg += " Note: existing document is in the trash."
 
@@ -213,14 +218,18 @@ class ConsumerPlugin(
                 f"[{Document.ARCHIVE_SERIAL_NUMBER_MIN:,}, "
                 f"{Document.ARCHIVE_SERIAL_NUMBER_MAX:,}]",
             )
-        existing_asn_doc = Document.global_objects.filter(
-            archive_serial_number=self.metadata.asn,
+        existing_asn_doc = (
+            Document.global_objects.filter(
+                archive_serial_number=self.metadata.asn,
+            )
+            .only("pk", "deleted_at")
+            .first()
         )
-        if existing_asn_doc.exists():
+        if existing_asn_doc is not None:
             msg = ConsumerStatusShortMessage.ASN_ALREADY_EXISTS
             log_msg = f"Not consuming {self.filename}: Given ASN {self.metadata.asn} already exists!"
 
-            if existing_asn_doc.first().deleted_at is not None:
+            if existing_asn_doc.deleted_at is not None:
                 msg = ConsumerStatusShortMessage.ASN_ALREADY_EXISTS_IN_TRASH
                 log_msg += " Note: existing document is in the trash."
 
@@ -489,6 +498,8 @@ class ConsumerPlugin(
             )
 
             text = document_parser.get_text()
+            # Detected before the transaction, it can take a while on long texts
+            language = detect_language(text)
             date = document_parser.get_date()
             if date is None:
                 self._send_progress(
@@ -546,6 +557,7 @@ class ConsumerPlugin(
                     date=date,
                     page_count=page_count,
                     mime_type=mime_type,
+                    language=language,
                 )
 
                 # If we get here, it was successful. Proceed with post-consume
@@ -680,6 +692,7 @@ class ConsumerPlugin(
         date: datetime.datetime | None,
         page_count: int | None,
         mime_type: str,
+        language: str,
     ) -> Document:
         # If someone gave us the original filename, use it instead of doc.
 
@@ -725,6 +738,7 @@ class ConsumerPlugin(
             modified=create_date,
             storage_type=storage_type,
             page_count=page_count,
+            language=language,
             original_filename=self.filename,
         )
 
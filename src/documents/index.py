@@ -200,6 +200,24 @@ def add_or_update_document(document: Document):
         update_document(writer, document)
 
 
+def add_or_update_document_by_id(document_id: int):
+    """
+    Loads the document with everything the index needs in one go, instead of
+    lazily fetching each relation, and adds or updates it in the index
+    """
+    document = (
+        Document.objects.select_related(
+            "correspondent",
+            "document_type",
+            "storage_path",
+            "owner",
+        )
+        .prefetch_related("tags")
+        .get(pk=document_id)
+    )
+    add_or_update_document(document)
+
+
 def remove_document_from_index(document: Document):
     with open_index_writer() as writer:
         remove_document(writer, document)
@@ -275,6 +293,9 @@ class DelayedQuery:
         self.saved_results = dict()
         self.first_score = None
         self.filter_queryset = filter_queryset
+        # Built on first access and shared by all pages of this query
+        self._query = None
+        self._filter = None
 
     def __len__(self):
         page = self[0:1]
@@ -284,13 +305,17 @@ class DelayedQuery:
         if item.start in self.saved_results:
             return self.saved_results[item.start]
 
-        q, mask = self._get_query()
+        if self._query is None:
+            self._query = self._get_query()
+        if self._filter is None:
+            self._filter = MappedDocIdSet(self.filter_queryset, self.searcher.ixreader)
+        q, mask = self._query
         sortedby, reverse = self._get_query_sortedby()
 
         page: ResultsPage = self.searcher.search_page(
             q,
             mask=mask,
-            filter=MappedDocIdSet(self.filter_queryset, self.searcher.ixreader),
+            filter=self._filter,
             pagenum=math.floor(item.start / self.page_size) + 1,
             pagelen=self.page_size,
             sortedby=sortedby,
@@ -356,10 +381,6 @@ class DelayedFullTextQuery(DelayedQuery):
         )
         q = qp.parse(q_str)
 
-        corrected = self.searcher.correct_query(q, q_str)
-        if corrected.query != q:
-            corrected.query = corrected.string
-
         return q, None
 
 
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.1 on 2026-10-15 09:10
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documents", "1055_alter_storagepath_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="language",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="The language detected from the content of the document.",
+                max_length=16,
+                null=True,
+                verbose_name="language",
+            ),
+        ),
+    ]
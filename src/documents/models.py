@@ -219,6 +219,17 @@ class Document(SoftDeleteModel, ModelWithOwner):
         ),
     )
 
+    language = models.CharField(
+        _("language"),
+        max_length=16,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_(
+            "The language detected from the content of the document.",
+        ),
+    )
+
     created = models.DateTimeField(_("created"), default=timezone.now, db_index=True)
 
     modified = models.DateTimeField(
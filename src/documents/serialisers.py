@@ -33,6 +33,7 @@ if settings.AUDIT_LOG_ENABLED:
     from auditlog.context import set_actor
 
 from documents import bulk_edit
+from documents.caching import clear_document_caches
 from documents.data_models import DocumentSource
 from documents.models import Correspondent
 from documents.models import CustomField
@@ -199,6 +200,11 @@ class OwnedObjectSerializer(
             pass
 
     def get_permissions(self, obj):
+        # The parent may have already loaded the permissions for all objects.
+        object_permissions = self.context.get("object_permissions")
+        if object_permissions is not None and obj.pk in object_permissions:
+            return object_permissions[obj.pk]
+
         view_codename = f"view_{obj.__class__.__name__.lower()}"
         change_codename = f"change_{obj.__class__.__name__.lower()}"
 
@@ -228,7 +234,10 @@ class OwnedObjectSerializer(
         }
 
     def get_user_can_change(self, obj):
-        checker = ObjectPermissionChecker(self.user) if self.user is not None else None
+        # The parent may have already prefetched object permissions for the page.
+        checker = self.context.get("permission_checker")
+        if checker is None and self.user is not None:
+            checker = ObjectPermissionChecker(self.user)
         return (
             obj.owner is None
             or obj.owner == self.user
@@ -270,6 +279,45 @@ class OwnedObjectSerializer(
 
         return set(user_permission_pks) | set(group_permission_pks)
 
+    @staticmethod
+    def get_object_permissions(objects: Iterable) -> dict:
+        """
+        Return the ids of the users and groups with view and change permissions
+        for each of the objects, in the format of `get_permissions`.
+        """
+        try:
+            first_obj = next(iter(objects))
+        except StopIteration:
+            return {}
+
+        ctype = ContentType.objects.get_for_model(first_obj)
+        model_name = first_obj.__class__.__name__.lower()
+        actions = {f"view_{model_name}": "view", f"change_{model_name}": "change"}
+        pk_type = type(first_obj.pk)
+        object_permissions = {
+            obj.pk: {action: {"users": [], "groups": []} for action in actions.values()}
+            for obj in objects
+        }
+
+        for model, key, id_field in (
+            (get_user_obj_perms_model(), "users", "user_id"),
+            (get_group_obj_perms_model(), "groups", "group_id"),
+        ):
+            for object_pk, codename, target_id in (
+                model.objects.filter(
+                    content_type=ctype,
+                    object_pk__in=list(object_permissions),
+                    permission__codename__in=list(actions),
+                )
+                .order_by(id_field)
+                .values_list("object_pk", "permission__codename", id_field)
+            ):
+                object_permissions[pk_type(object_pk)][actions[codename]][key].append(
+                    target_id,
+                )
+
+        return object_permissions
+
     def get_is_shared_by_requester(self, obj: Document):
         # First check the context to see if `shared_object_pks` is set by the parent.
         shared_object_pks = self.context.get("shared_object_pks")
@@ -334,9 +382,15 @@ class OwnedObjectSerializer(
 
 class OwnedObjectListSerializer(serializers.ListSerializer):
     def to_representation(self, documents):
-        self.child.context["shared_object_pks"] = self.child.get_shared_object_pks(
-            documents,
-        )
+        if "is_shared_by_requester" in self.child.fields:
+            self.child.context["shared_object_pks"] = self.child.get_shared_object_pks(
+                documents,
+            )
+        # Load the full permissions for all objects at once, not per object.
+        if "permissions" in self.child.fields:
+            self.child.context["object_permissions"] = (
+                self.child.get_object_permissions(documents)
+            )
         return super().to_representation(documents)
 
 
@@ -359,6 +413,7 @@ class CorrespondentSerializer(MatchingModelSerializer, OwnedObjectSerializer):
             "user_can_change",
             "set_permissions",
         )
+        list_serializer_class = OwnedObjectListSerializer
 
 
 class DocumentTypeSerializer(MatchingModelSerializer, OwnedObjectSerializer):
@@ -377,6 +432,7 @@ class DocumentTypeSerializer(MatchingModelSerializer, OwnedObjectSerializer):
             "user_can_change",
             "set_permissions",
         )
+        list_serializer_class = OwnedObjectListSerializer
 
 
 class ColorField(serializers.Field):
@@ -429,6 +485,7 @@ class TagSerializerVersion1(MatchingModelSerializer, OwnedObjectSerializer):
             "user_can_change",
             "set_permissions",
         )
+        list_serializer_class = OwnedObjectListSerializer
 
 
 class TagSerializer(MatchingModelSerializer, OwnedObjectSerializer):
@@ -465,6 +522,7 @@ class TagSerializer(MatchingModelSerializer, OwnedObjectSerializer):
             "user_can_change",
             "set_permissions",
         )
+        list_serializer_class = OwnedObjectListSerializer
 
     def validate_color(self, color):
         regex = r"#[0-9a-fA-F]{6}"
@@ -807,6 +865,14 @@ class DocumentSerializer(
             instance.save()
         if "created_date" in validated_data:
             validated_data.pop("created_date")
+        if (
+            "content" in validated_data
+            and validated_data["content"] != instance.content
+        ):
+            # Detected again the next time the metadata is requested
+            instance.language = None
+            # Suggestions are derived from the content
+            clear_document_caches(instance.pk)
         if instance.custom_fields.count() > 0 and "custom_fields" in validated_data:
             incoming_custom_fields = [
                 field["field"] for field in validated_data["custom_fields"]
@@ -912,6 +978,15 @@ class SearchResultListSerializer(serializers.ListSerializer):
         self.child.context["shared_object_pks"] = self.child.get_shared_object_pks(
             documents.values(),
         )
+        # Load the requesting user's object permissions for all hits at once.
+        if (
+            documents
+            and self.child.user is not None
+            and "user_can_change" in self.child.fields
+        ):
+            checker = ObjectPermissionChecker(self.child.user)
+            checker.prefetch_perms(list(documents.values()))
+            self.child.context["permission_checker"] = checker
 
         return super().to_representation(hits)
 
@@ -930,7 +1005,7 @@ class SearchResultSerializer(DocumentSerializer):
                 "document_type",
                 "owner",
             )
-            .prefetch_related("tags", "custom_fields", "notes")
+            .prefetch_related("tags", "custom_fields__field", "notes")
             .filter(id__in=ids)
         }
 
@@ -990,6 +1065,7 @@ class SavedViewSerializer(OwnedObjectSerializer):
             "user_can_change",
             "set_permissions",
         ]
+        list_serializer_class = OwnedObjectListSerializer
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
@@ -1458,6 +1534,10 @@ class BulkDownloadSerializer(DocumentListSerializer):
         default=False,
     )
 
+    background = serializers.BooleanField(
+        default=False,
+    )
+
     def validate_compression(self, compression):
         import zipfile
 
@@ -1486,6 +1566,7 @@ class StoragePathSerializer(MatchingModelSerializer, OwnedObjectSerializer):
             "user_can_change",
             "set_permissions",
         )
+        list_serializer_class = OwnedObjectListSerializer
 
     def validate_path(self, path: str):
         converted_path = convert_format_str_to_template_format(path)
@@ -1505,7 +1586,7 @@ class StoragePathSerializer(MatchingModelSerializer, OwnedObjectSerializer):
         When a storage path is updated, see if documents
         using it require a rename/move
         """
-        doc_ids = [doc.id for doc in instance.documents.all()]
+        doc_ids = list(instance.documents.values_list("id", flat=True))
         if len(doc_ids):
             bulk_edit.bulk_update_documents.delay(doc_ids)
 
@@ -1610,6 +1691,7 @@ class ShareLinkSerializer(OwnedObjectSerializer):
             "document",
             "file_version",
         )
+        list_serializer_class = OwnedObjectListSerializer
 
     def create(self, validated_data):
         validated_data["slug"] = get_random_string(50)
@@ -1,10 +1,12 @@
 import hashlib
 import logging
+import os
 import shutil
 import uuid
 from datetime import timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from tempfile import mkstemp
 
 import tqdm
 from celery import Task
@@ -20,6 +22,9 @@ from whoosh.writing import AsyncWriter
 from documents import index
 from documents import sanity_checker
 from documents.barcodes import BarcodePlugin
+from documents.bulk_download import BULK_DOWNLOAD_SUFFIX
+from documents.bulk_download import write_bulk_archive
+from documents.caching import CACHE_50_MINUTES
 from documents.caching import clear_document_caches
 from documents.classifier import DocumentClassifier
 from documents.classifier import load_classifier
@@ -44,6 +49,7 @@ from documents.plugins.helpers import ProgressStatusOptions
 from documents.sanity_checker import SanityCheckFailedException
 from documents.signals import document_updated
 from documents.signals.handlers import cleanup_document_deletion
+from documents.utils import detect_language
 
 if settings.AUDIT_LOG_ENABLED:
     from auditlog.models import LogEntry
@@ -235,6 +241,8 @@ def update_document_archive_file(document_id):
         )
 
         if parser.get_archive_path():
+            content = parser.get_text()
+            language = detect_language(content)
             with transaction.atomic():
                 with open(parser.get_archive_path(), "rb") as f:
                     checksum = hashlib.md5(f.read()).hexdigest()
@@ -249,7 +257,8 @@ def update_document_archive_file(document_id):
                 oldDocument = Document.objects.get(pk=document.pk)
                 Document.objects.filter(pk=document.pk).update(
                     archive_checksum=checksum,
-                    content=parser.get_text(),
+                    content=content,
+                    language=language,
                     archive_filename=document.archive_filename,
                 )
                 newDocument = Document.objects.get(pk=document.pk)
@@ -319,3 +328,49 @@ def empty_trash(doc_ids=None):
             cleanup_document_deletion,
             sender=Document,
         )
+
+
+@shared_task
+def build_bulk_download(
+    document_ids: list[int],
+    compression: int,
+    content: str,
+    follow_formatting: bool = False,
+) -> str:
+    """
+    Builds a bulk download zip file in the scratch directory and returns its path
+    """
+    settings.SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
+    fd, path = mkstemp(dir=settings.SCRATCH_DIR, suffix=BULK_DOWNLOAD_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_bulk_archive(
+                f,
+                document_ids,
+                compression,
+                content,
+                follow_formatting,
+            )
+    except Exception:
+        Path(path).unlink(missing_ok=True)
+        raise
+    return path
+
+
+@shared_task
+def cleanup_bulk_downloads():
+    """
+    Removes bulk download zip files which were not collected while their
+    result could still be fetched
+    """
+    if not settings.SCRATCH_DIR.exists():
+        return
+    cutoff = timezone.now().timestamp() - CACHE_50_MINUTES
+    for path in settings.SCRATCH_DIR.glob(f"*{BULK_DOWNLOAD_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                logger.debug(f"Removed expired bulk download {path}")
+        except FileNotFoundError:  # pragma: no cover
+            # Collected or removed in the meantime
+            pass
@@ -4,16 +4,21 @@ import json
 import os
 import shutil
 import zipfile
+from pathlib import Path
+from unittest import mock
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import override_settings
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from documents.caching import get_bulk_download_cache_key
 from documents.models import Correspondent
 from documents.models import Document
 from documents.models import DocumentType
+from documents.tasks import build_bulk_download
 from documents.tests.utils import DirectoriesMixin
 
 
@@ -23,8 +28,9 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
     def setUp(self):
         super().setUp()
 
-        user = User.objects.create_superuser(username="temp_admin")
-        self.client.force_authenticate(user=user)
+        self.user = User.objects.create_superuser(username="temp_admin")
+        self.client.force_authenticate(user=self.user)
+        cache.clear()
 
         self.doc1 = Document.objects.create(title="unrelated", checksum="A")
         self.doc2 = Document.objects.create(
@@ -80,7 +86,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 2)
             self.assertIn("2021-01-01 document A.pdf", zipf.namelist())
             self.assertIn("2020-03-21 document B.jpg", zipf.namelist())
@@ -101,7 +107,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 2)
             self.assertIn("2021-01-01 document A.pdf", zipf.namelist())
             self.assertIn("2020-03-21 document B.pdf", zipf.namelist())
@@ -122,7 +128,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 3)
             self.assertIn("originals/2021-01-01 document A.pdf", zipf.namelist())
             self.assertIn("archive/2020-03-21 document B.pdf", zipf.namelist())
@@ -156,7 +162,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 2)
 
             self.assertIn("2021-01-01 document A.pdf", zipf.namelist())
@@ -169,13 +175,70 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
                 self.assertEqual(f.read(), zipf.read("2021-01-01 document A_01.pdf"))
 
     def test_compression(self):
-        self.client.post(
+        response = self.client.post(
             self.ENDPOINT,
             json.dumps(
                 {"documents": [self.doc2.id, self.doc2b.id], "compression": "lzma"},
             ),
             content_type="application/json",
         )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Removes the streamed temporary archive
+        response.close()
+
+    def test_compression_skips_precompressed_files(self):
+        """
+        GIVEN:
+            - Documents which are already compressed and a plain text document
+        WHEN:
+            - Bulk download request with compression
+        THEN:
+            - Compressed formats are stored as is, only the text file is compressed
+        """
+        doc_txt = Document.objects.create(
+            title="document C",
+            filename="docC.txt",
+            mime_type="text/plain",
+            checksum="E",
+            created=timezone.make_aware(datetime.datetime(2022, 5, 1)),
+        )
+        shutil.copy(
+            os.path.join(os.path.dirname(__file__), "samples", "simple.txt"),
+            doc_txt.source_path,
+        )
+
+        response = self.client.post(
+            self.ENDPOINT,
+            json.dumps(
+                {
+                    "documents": [self.doc2.id, self.doc3.id, doc_txt.id],
+                    "content": "both",
+                    "compression": "deflated",
+                },
+            ),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
+            compress_types = {
+                info.filename: info.compress_type for info in zipf.infolist()
+            }
+            self.assertEqual(
+                compress_types,
+                {
+                    "originals/2021-01-01 document A.pdf": zipfile.ZIP_STORED,
+                    "archive/2020-03-21 document B.pdf": zipfile.ZIP_STORED,
+                    "originals/2020-03-21 document B.jpg": zipfile.ZIP_STORED,
+                    "originals/2022-05-01 document C.txt": zipfile.ZIP_DEFLATED,
+                },
+            )
+            with doc_txt.source_file as f:
+                self.assertEqual(
+                    f.read(),
+                    zipf.read("originals/2022-05-01 document C.txt"),
+                )
 
     @override_settings(FILENAME_FORMAT="{correspondent}/{title}")
     def test_formatted_download_originals(self):
@@ -215,7 +278,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 2)
             self.assertIn("a space name/Title 2 - Doc 3.jpg", zipf.namelist())
             self.assertIn("test/This is Doc 2.pdf", zipf.namelist())
@@ -261,7 +324,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 2)
             self.assertIn("somewhere/This is Doc 2.pdf", zipf.namelist())
             self.assertIn("somewhere/Title 2 - Doc 3.pdf", zipf.namelist())
@@ -310,7 +373,7 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/zip")
 
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
             self.assertEqual(len(zipf.filelist), 3)
             self.assertIn("originals/bill/This is Doc 2.pdf", zipf.namelist())
             self.assertIn("archive/statement/Title 2 - Doc 3.pdf", zipf.namelist())
@@ -333,3 +396,177 @@ class TestBulkDownload(DirectoriesMixin, APITestCase):
                     f.read(),
                     zipf.read("originals/statement/Title 2 - Doc 3.jpg"),
                 )
+
+    @mock.patch("documents.views.build_bulk_download.delay")
+    def test_download_background(self, m):
+        """
+        GIVEN:
+            - Documents to download
+        WHEN:
+            - A bulk download is requested to be built in the background
+        THEN:
+            - The archive is built by a task
+            - The task id is returned instead of the archive
+        """
+        m.return_value = mock.Mock(id="abc123")
+
+        response = self.client.post(
+            self.ENDPOINT,
+            json.dumps(
+                {
+                    "documents": [self.doc2.id, self.doc3.id],
+                    "content": "originals",
+                    "background": True,
+                },
+            ),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"task_id": "abc123"})
+        m.assert_called_once_with(
+            document_ids=[self.doc2.id, self.doc3.id],
+            compression=zipfile.ZIP_STORED,
+            content="originals",
+            follow_formatting=False,
+        )
+
+    @mock.patch("documents.views.celery_app.AsyncResult")
+    def test_download_background_result(self, m):
+        """
+        GIVEN:
+            - A bulk download built in the background
+        WHEN:
+            - The result is requested while the task is running
+            - The result is requested once the task finished
+            - The result is requested again
+        THEN:
+            - The task status is returned while it is running
+            - The archive is returned and removed afterwards
+            - The result is not found again
+        """
+        path = build_bulk_download(
+            [self.doc2.id, self.doc3.id],
+            zipfile.ZIP_STORED,
+            "originals",
+        )
+        m.return_value.ready.return_value = False
+        m.return_value.state = "STARTED"
+        with mock.patch("documents.views.build_bulk_download.delay") as delay:
+            delay.return_value = mock.Mock(id="abc123")
+            self.client.post(
+                self.ENDPOINT,
+                json.dumps({"documents": [self.doc2.id], "background": True}),
+                content_type="application/json",
+            )
+
+        response = self.client.get(f"{self.ENDPOINT}abc123/")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data, {"status": "STARTED"})
+
+        m.return_value.ready.return_value = True
+        m.return_value.successful.return_value = True
+        m.return_value.result = path
+
+        response = self.client.get(f"{self.ENDPOINT}abc123/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as zipf:
+            self.assertCountEqual(
+                zipf.namelist(),
+                ["2021-01-01 document A.pdf", "2020-03-21 document B.jpg"],
+            )
+        response.close()
+        self.assertFalse(Path(path).exists())
+
+        response = self.client.get(f"{self.ENDPOINT}abc123/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_download_background_result_other_user(self):
+        """
+        GIVEN:
+            - A bulk download built in the background for another user
+        WHEN:
+            - The result is requested
+        THEN:
+            - The result is not found
+        """
+        other_user = User.objects.create_superuser(username="other_admin")
+        with mock.patch("documents.views.build_bulk_download.delay") as delay:
+            delay.return_value = mock.Mock(id="abc123")
+            self.client.force_authenticate(user=other_user)
+            self.client.post(
+                self.ENDPOINT,
+                json.dumps({"documents": [self.doc2.id], "background": True}),
+                content_type="application/json",
+            )
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(f"{self.ENDPOINT}abc123/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @mock.patch("documents.views.celery_app.AsyncResult")
+    def test_download_background_result_failed(self, m):
+        """
+        GIVEN:
+            - A bulk download built in the background
+        WHEN:
+            - The task building it failed
+        THEN:
+            - A server error is returned
+        """
+        m.return_value.ready.return_value = True
+        m.return_value.successful.return_value = False
+        cache.set(get_bulk_download_cache_key("abc123"), self.user.id)
+
+        response = self.client.get(f"{self.ENDPOINT}abc123/")
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    @mock.patch("documents.views.celery_app.AsyncResult")
+    def test_download_background_result_claimed(self, m):
+        """
+        GIVEN:
+            - A finished bulk download built in the background
+        WHEN:
+            - Another request collected the result in the meantime
+        THEN:
+            - The result is not found
+            - The archive is left to the request which collected it
+        """
+        path = build_bulk_download([self.doc2.id], zipfile.ZIP_STORED, "originals")
+        m.return_value.ready.return_value = True
+        m.return_value.successful.return_value = True
+        m.return_value.result = path
+        cache.set(get_bulk_download_cache_key("abc123"), self.user.id)
+
+        with mock.patch("documents.views.cache.delete", return_value=False):
+            response = self.client.get(f"{self.ENDPOINT}abc123/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Path(path).exists())
+        Path(path).unlink()
+
+    @mock.patch("documents.views.celery_app.AsyncResult")
+    def test_download_background_result_missing(self, m):
+        """
+        GIVEN:
+            - A finished bulk download built in the background
+        WHEN:
+            - The archive was removed before it was collected
+        THEN:
+            - The result is not found
+            - The result cannot be requested again
+        """
+        m.return_value.ready.return_value = True
+        m.return_value.successful.return_value = True
+        m.return_value.result = str(Path(self.dirs.scratch_dir) / "missing.zip")
+        cache.set(get_bulk_download_cache_key("abc123"), self.user.id)
+
+        response = self.client.get(f"{self.ENDPOINT}abc123/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIsNone(cache.get(get_bulk_download_cache_key("abc123")))
@@ -8,6 +8,7 @@ from rest_framework.test import APITestCase
 
 from documents.models import Correspondent
 from documents.models import CustomField
+from documents.models import CustomFieldInstance
 from documents.models import Document
 from documents.models import DocumentType
 from documents.models import StoragePath
@@ -695,6 +696,17 @@ class TestBulkEditAPI(DirectoriesMixin, APITestCase):
             )
 
     def test_api_selection_data(self):
+        self.doc1.storage_path = self.sp1
+        self.doc1.save()
+        self.doc3.storage_path = self.sp1
+        self.doc3.save()
+        cf3 = CustomField.objects.create(
+            name="cf3",
+            data_type=CustomField.FieldDataType.STRING,
+        )
+        CustomFieldInstance.objects.create(document=self.doc2, field=cf3)
+        CustomFieldInstance.objects.create(document=self.doc3, field=cf3)
+
         response = self.client.post(
             "/api/documents/selection_data/",
             json.dumps(
@@ -725,6 +737,20 @@ class TestBulkEditAPI(DirectoriesMixin, APITestCase):
                 {"id": self.c2.id, "document_count": 0},
             ],
         )
+        self.assertCountEqual(
+            response.data["selected_storage_paths"],
+            [
+                {"id": self.sp1.id, "document_count": 1},
+            ],
+        )
+        self.assertCountEqual(
+            response.data["selected_custom_fields"],
+            [
+                {"id": self.cf1.id, "document_count": 0},
+                {"id": self.cf2.id, "document_count": 0},
+                {"id": cf3.id, "document_count": 1},
+            ],
+        )
 
     @mock.patch("documents.serialisers.bulk_edit.set_permissions")
     def test_set_permissions(self, m):
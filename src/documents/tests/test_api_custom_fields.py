@@ -3,6 +3,8 @@ from datetime import date
 
 from django.contrib.auth.models import Permission
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -982,3 +984,57 @@ class TestCustomFieldsAPI(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         results = response.data["results"]
         self.assertEqual(results[0]["document_count"], 0)
+
+    def test_custom_field_values_listing_queries(self):
+        """
+        GIVEN:
+            - Documents with custom field values
+        WHEN:
+            - API request to list documents is made
+        THEN:
+            - The number of queries does not grow with the number of documents
+        """
+        custom_field_string = CustomField.objects.create(
+            name="Test Custom Field String",
+            data_type=CustomField.FieldDataType.STRING,
+        )
+        custom_field_int = CustomField.objects.create(
+            name="Test Custom Field Int",
+            data_type=CustomField.FieldDataType.INT,
+        )
+
+        def create_documents(count: int):
+            for _ in range(count):
+                doc = Document.objects.create(
+                    title="WOW",
+                    content="the content",
+                    checksum=str(Document.objects.count()),
+                    mime_type="application/pdf",
+                )
+                CustomFieldInstance.objects.create(
+                    document=doc,
+                    field=custom_field_string,
+                    value_text="test value",
+                )
+                CustomFieldInstance.objects.create(
+                    document=doc,
+                    field=custom_field_int,
+                    value_int=42,
+                )
+
+        def count_list_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get("/api/documents/")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            for result in response.data["results"]:
+                self.assertCountEqual(
+                    [cf["value"] for cf in result["custom_fields"]],
+                    ["test value", 42],
+                )
+            return len(context.captured_queries)
+
+        create_documents(1)
+        queries = count_list_queries()
+
+        create_documents(3)
+        self.assertEqual(count_list_queries(), queries)
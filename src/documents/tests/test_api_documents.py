@@ -20,7 +20,9 @@ from django.utils import timezone
 from guardian.shortcuts import assign_perm
 from rest_framework import status
 from rest_framework.test import APITestCase
+from whoosh import query
 
+from documents import index
 from documents.caching import CACHE_50_MINUTES
 from documents.caching import CLASSIFIER_HASH_KEY
 from documents.caching import CLASSIFIER_MODIFIED_KEY
@@ -187,17 +189,17 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         response = self.client.get(f"/api/documents/{doc.pk}/download/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content)
+        self.assertEqual(response.getvalue(), content)
 
         response = self.client.get(f"/api/documents/{doc.pk}/preview/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content)
+        self.assertEqual(response.getvalue(), content)
 
         response = self.client.get(f"/api/documents/{doc.pk}/thumb/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content_thumbnail)
+        self.assertEqual(response.getvalue(), content_thumbnail)
 
     def test_document_actions_with_perms(self):
         """
@@ -279,26 +281,26 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         response = self.client.get(f"/api/documents/{doc.pk}/download/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content_archive)
+        self.assertEqual(response.getvalue(), content_archive)
 
         response = self.client.get(
             f"/api/documents/{doc.pk}/download/?original=true",
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content)
+        self.assertEqual(response.getvalue(), content)
 
         response = self.client.get(f"/api/documents/{doc.pk}/preview/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content_archive)
+        self.assertEqual(response.getvalue(), content_archive)
 
         response = self.client.get(
             f"/api/documents/{doc.pk}/preview/?original=true",
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content)
+        self.assertEqual(response.getvalue(), content)
 
     def test_document_actions_not_existing_file(self):
         doc = Document.objects.create(
@@ -894,6 +896,31 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
             [u1_doc1.id],
         )
 
+    def test_document_filters_multi_valued_join(self):
+        """
+        GIVEN:
+            - Document with multiple tags and notes
+        WHEN:
+            - API request filtering by more than one of its tags
+        THEN:
+            - Document is returned once
+        """
+        doc = Document.objects.create(title="test", checksum="A")
+        t1 = Tag.objects.create(name="t1")
+        t2 = Tag.objects.create(name="t2")
+        doc.tags.add(t1, t2)
+        Note.objects.create(document=doc, note="note 1", user=self.user)
+        Note.objects.create(document=doc, note="note 2", user=self.user)
+
+        response = self.client.get(
+            f"/api/documents/?tags__id__in={t1.id},{t2.id}&ordering=num_notes",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(list(response.data["all"]), [doc.id])
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(len(response.data["results"][0]["notes"]), 2)
+
     def test_pagination_all(self):
         """
         GIVEN:
@@ -977,6 +1004,28 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         self.assertEqual(response.data["documents_inbox"], None)
         self.assertEqual(response.data["inbox_tags"], None)
 
+    def test_statistics_multiple_inbox_tags(self):
+        """
+        GIVEN:
+            - A document with two inbox tags
+        WHEN:
+            - Statistics are requested
+        THEN:
+            - The document is counted once in the inbox
+            - The character count is not affected by the inbox tags
+        """
+        doc = Document.objects.create(title="none1", checksum="A", content="abc")
+        Document.objects.create(title="none2", checksum="B", content="12345")
+        inbox_1 = Tag.objects.create(name="inbox1", is_inbox_tag=True)
+        inbox_2 = Tag.objects.create(name="inbox2", is_inbox_tag=True)
+        doc.tags.add(inbox_1, inbox_2)
+
+        response = self.client.get("/api/statistics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["documents_total"], 2)
+        self.assertEqual(response.data["documents_inbox"], 1)
+        self.assertEqual(response.data["character_count"], 8)
+
     def test_statistics_multiple_users(self):
         """
         GIVEN:
@@ -1461,6 +1510,72 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         response = self.client.get(f"/api/documents/{doc.pk}/metadata/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_get_metadata_language(self):
+        """
+        GIVEN:
+            - Document without a detected language
+        WHEN:
+            - API to get document metadata is called
+        THEN:
+            - Language is detected once and stored on the document
+        """
+        doc = Document.objects.create(
+            title="test",
+            filename="file.pdf",
+            mime_type="application/pdf",
+            content="This is a document written in plain english, nothing else.",
+        )
+        self.assertIsNone(doc.language)
+
+        shutil.copy(
+            os.path.join(os.path.dirname(__file__), "samples", "simple.pdf"),
+            doc.source_path,
+        )
+
+        response = self.client.get(f"/api/documents/{doc.pk}/metadata/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["lang"], "en")
+
+        doc.refresh_from_db()
+        self.assertEqual(doc.language, "en")
+
+    def test_update_content_resets_language(self):
+        """
+        GIVEN:
+            - Document with a detected language
+        WHEN:
+            - The title is updated
+            - The content is updated
+        THEN:
+            - The language is kept when the content is unchanged
+            - The language is reset, to be detected again from the new content
+        """
+        doc = Document.objects.create(
+            title="test",
+            checksum="123",
+            mime_type="application/pdf",
+            content="This is a document written in plain english, nothing else.",
+            language="en",
+        )
+
+        response = self.client.patch(
+            f"/api/documents/{doc.pk}/",
+            {"title": "new title"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        doc.refresh_from_db()
+        self.assertEqual(doc.language, "en")
+
+        response = self.client.patch(
+            f"/api/documents/{doc.pk}/",
+            {"content": "Dies ist ein Dokument, das auf Deutsch geschrieben ist."},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        doc.refresh_from_db()
+        self.assertIsNone(doc.language)
+
     def test_get_metadata_invalid_doc(self):
         response = self.client.get("/api/documents/34576/metadata/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1656,6 +1771,44 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         response = self.client.get(f"/api/documents/{doc.pk}/suggestions/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    @mock.patch("documents.views.parse_date_generator")
+    @override_settings(NUMBER_OF_SUGGESTED_DATES=10)
+    def test_get_suggestions_dates_cached(self, parse_date_generator):
+        """
+        GIVEN:
+            - Document with a date in its content
+        WHEN:
+            - API request for document suggestions is made repeatedly
+            - Document content is updated
+        THEN:
+            - Dates are only parsed once until the content changes
+        """
+        parse_date_generator.side_effect = lambda filename, content: iter(
+            [timezone.datetime(2022, 4, 12)],
+        )
+        doc = Document.objects.create(
+            title="test",
+            mime_type="application/pdf",
+            checksum="123",
+            content="this is an invoice from 12.04.2022!",
+        )
+
+        for _ in range(2):
+            response = self.client.get(f"/api/documents/{doc.pk}/suggestions/")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["dates"], ["2022-04-12"])
+        self.assertEqual(parse_date_generator.call_count, 1)
+
+        response = self.client.patch(
+            f"/api/documents/{doc.pk}/",
+            {"content": "this is an invoice from 13.04.2022!"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.get(f"/api/documents/{doc.pk}/suggestions/")
+        self.assertEqual(parse_date_generator.call_count, 2)
+
     @mock.patch("documents.parsers.parse_date_generator")
     @override_settings(NUMBER_OF_SUGGESTED_DATES=0)
     def test_get_suggestions_dates_disabled(
@@ -1967,6 +2120,22 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertListEqual(response.data, ["test", "test2"])
 
+    def test_get_log_with_limit(self):
+        log_data = "test1\ntest2\ntest3\n"
+        with open(os.path.join(settings.LOGGING_DIR, "paperless.log"), "w") as f:
+            f.write(log_data)
+        response = self.client.get("/api/logs/paperless/", {"limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(response.data, ["test2", "test3"])
+
+    def test_get_log_with_invalid_limit(self):
+        log_data = "test1\ntest2\n"
+        with open(os.path.join(settings.LOGGING_DIR, "paperless.log"), "w") as f:
+            f.write(log_data)
+        for limit in [0, -1, "abc"]:
+            response = self.client.get("/api/logs/paperless/", {"limit": limit})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_invalid_regex_other_algorithm(self):
         for endpoint in ["correspondents", "tags", "document_types"]:
             response = self.client.post(
@@ -2116,6 +2285,7 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
             - API request is made to add a note
         THEN:
             - note is created and associated with document, modified time is updated
+            - note is searchable in the index
         """
         doc = Document.objects.create(
             title="test",
@@ -2152,6 +2322,10 @@ class TestDocumentApi(DirectoriesMixin, DocumentConsumeDelayMixin, APITestCase):
         # modified was updated to today
         self.assertEqual(doc.modified.day, timezone.now().day)
 
+        with index.open_index_searcher() as searcher:
+            results = searcher.search(query.Term("notes", "posted"))
+            self.assertEqual([r["id"] for r in results], [doc.pk])
+
     def test_notes_permissions_aware(self):
         """
         GIVEN:
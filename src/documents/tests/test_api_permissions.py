@@ -1,4 +1,5 @@
 import json
+from unittest import mock
 
 from django.contrib.auth.models import Group
 from django.contrib.auth.models import Permission
@@ -461,6 +462,114 @@ class TestApiAuth(DirectoriesMixin, APITestCase):
         self.assertNotIn("user_can_change", results[0])
         self.assertNotIn("is_shared_by_requester", results[0])
 
+        response = self.client.get(
+            "/api/documents/?full_perms=false",
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.json()["results"]
+
+        self.assertNotIn("permissions", results[0])
+        self.assertIn("user_can_change", results[0])
+
+    def test_list_full_permissions(self):
+        """
+        GIVEN:
+            - Objects with view and change permissions for users and groups
+        WHEN:
+            - API request to list the objects with full permissions
+        THEN:
+            - The permissions of every object match those of retrieving it
+        """
+        admin = User.objects.create_superuser(username="admin")
+        user1 = User.objects.create_user(username="user1")
+        user2 = User.objects.create_user(username="user2")
+        group1 = Group.objects.create(name="group1")
+
+        tag1 = Tag.objects.create(name="tag1", owner=admin)
+        tag2 = Tag.objects.create(name="tag2", owner=admin)
+        tag3 = Tag.objects.create(name="tag3", owner=admin)
+
+        assign_perm("view_tag", user1, tag1)
+        assign_perm("view_tag", user2, tag1)
+        assign_perm("change_tag", user2, tag1)
+        assign_perm("view_tag", group1, tag1)
+        assign_perm("change_tag", group1, tag2)
+
+        self.client.force_authenticate(admin)
+
+        response = self.client.get("/api/tags/?full_perms=true", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        permissions = {
+            result["id"]: result["permissions"] for result in response.data["results"]
+        }
+        self.assertEqual(
+            permissions[tag1.id],
+            {
+                "view": {"users": [user1.id, user2.id], "groups": [group1.id]},
+                "change": {"users": [user2.id], "groups": []},
+            },
+        )
+        self.assertEqual(
+            permissions[tag2.id],
+            {
+                "view": {"users": [], "groups": []},
+                "change": {"users": [], "groups": [group1.id]},
+            },
+        )
+
+        for tag in [tag1, tag2, tag3]:
+            response = self.client.get(
+                f"/api/tags/{tag.id}/?full_perms=true",
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            retrieved = response.data["permissions"]
+            for action in ["view", "change"]:
+                for key in ["users", "groups"]:
+                    self.assertCountEqual(
+                        permissions[tag.id][action][key],
+                        retrieved[action][key],
+                    )
+
+    def test_list_full_permissions_skips_shared_objects(self):
+        """
+        GIVEN:
+            - Documents owned by the requesting user
+        WHEN:
+            - API request to list the documents with and without full permissions
+        THEN:
+            - Shared documents are only looked up if the response reports them
+        """
+        admin = User.objects.create_superuser(username="admin")
+        Document.objects.create(
+            title="doc1",
+            checksum="1",
+            mime_type="application/pdf",
+            owner=admin,
+        )
+        self.client.force_authenticate(admin)
+
+        with mock.patch(
+            "documents.serialisers.OwnedObjectSerializer.get_shared_object_pks",
+            return_value=set(),
+        ) as get_shared_object_pks:
+            response = self.client.get(
+                "/api/documents/?full_perms=true",
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("is_shared_by_requester", response.data["results"][0])
+            get_shared_object_pks.assert_not_called()
+
+            response = self.client.get("/api/documents/", format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn("is_shared_by_requester", response.data["results"][0])
+            get_shared_object_pks.assert_called_once()
+
 
 class TestApiUser(DirectoriesMixin, APITestCase):
     ENDPOINT = "/api/users/"
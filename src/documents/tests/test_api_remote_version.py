@@ -3,6 +3,8 @@ import urllib.request
 from unittest import mock
 from unittest.mock import MagicMock
 
+from django.core.cache import cache
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -15,6 +17,7 @@ class TestApiRemoteVersion(DirectoriesMixin, APITestCase):
 
     def setUp(self):
         super().setUp()
+        cache.clear()
 
     @mock.patch("urllib.request.urlopen")
     def test_remote_version_enabled_no_update_prefix(self, urlopen_mock):
@@ -121,3 +124,86 @@ class TestApiRemoteVersion(DirectoriesMixin, APITestCase):
                 "update_available": False,
             },
         )
+
+    @mock.patch("urllib.request.urlopen")
+    def test_remote_version_timeout(self, urlopen_mock):
+        """
+        GIVEN:
+            - GitHub times out while the response is read
+        WHEN:
+            - The remote version is requested twice
+        THEN:
+            - No update is reported
+            - The failure is cached, GitHub is not asked again
+        """
+        cm = MagicMock()
+        cm.read.side_effect = TimeoutError("timed out")
+        cm.__enter__.return_value = cm
+        urlopen_mock.return_value = cm
+
+        for _ in range(2):
+            response = self.client.get(self.ENDPOINT)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertDictEqual(
+                response.data,
+                {
+                    "version": "0.0.0",
+                    "update_available": False,
+                },
+            )
+
+        urlopen_mock.assert_called_once()
+
+    @mock.patch("urllib.request.urlopen")
+    def test_remote_version_cached(self, urlopen_mock):
+        """
+        GIVEN:
+            - Remote version was requested before
+        WHEN:
+            - The remote version is requested again
+        THEN:
+            - The cached version is returned without asking GitHub again
+        """
+        cm = MagicMock()
+        cm.getcode.return_value = status.HTTP_200_OK
+        cm.read.return_value = json.dumps({"tag_name": "ngx-1.6.0"}).encode()
+        cm.__enter__.return_value = cm
+        urlopen_mock.return_value = cm
+
+        for _ in range(2):
+            response = self.client.get(self.ENDPOINT)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertDictEqual(
+                response.data,
+                {
+                    "version": "1.6.0",
+                    "update_available": False,
+                },
+            )
+
+        urlopen_mock.assert_called_once()
+
+    @override_settings(ENABLE_UPDATE_CHECK=False)
+    @mock.patch("urllib.request.urlopen")
+    def test_remote_version_update_check_disabled(self, urlopen_mock):
+        """
+        GIVEN:
+            - Update checking is disabled
+        WHEN:
+            - The remote version is requested
+        THEN:
+            - The current version is returned without asking GitHub
+        """
+        response = self.client.get(self.ENDPOINT)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.data,
+            {
+                "version": version.__full_version_str__,
+                "update_available": False,
+            },
+        )
+        urlopen_mock.assert_not_called()
@@ -7,6 +7,7 @@ from dateutil.relativedelta import relativedelta
 from django.contrib.auth.models import Group
 from django.contrib.auth.models import Permission
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import override_settings
 from django.utils import timezone
 from guardian.shortcuts import assign_perm
@@ -37,6 +38,7 @@ class TestDocumentSearchApi(DirectoriesMixin, APITestCase):
 
         self.user = User.objects.create_superuser(username="temp_admin")
         self.client.force_authenticate(user=self.user)
+        cache.clear()
 
     def test_search(self):
         d1 = Document.objects.create(
@@ -125,6 +127,40 @@ class TestDocumentSearchApi(DirectoriesMixin, APITestCase):
             self.assertNotIn(result["id"], seen_ids)
             seen_ids.append(result["id"])
 
+    def test_search_query_parsed_once(self):
+        """
+        GIVEN:
+            - Documents in the index
+        WHEN:
+            - API request to search a page other than the first
+        THEN:
+            - The query is only parsed once for counting and fetching the page
+        """
+        with AsyncWriter(index.open_index()) as writer:
+            for i in range(15):
+                doc = Document.objects.create(
+                    checksum=str(i),
+                    pk=i + 1,
+                    title=f"Document {i+1}",
+                    content="content",
+                )
+                index.update_document(writer, doc)
+
+        with mock.patch.object(
+            index.DelayedFullTextQuery,
+            "_get_query",
+            autospec=True,
+            side_effect=index.DelayedFullTextQuery._get_query,
+        ) as get_query:
+            response = self.client.get(
+                "/api/documents/?query=content&page=2&page_size=10",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 15)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(get_query.call_count, 1)
+
     def test_search_invalid_page(self):
         with AsyncWriter(index.open_index()) as writer:
             for i in range(15):
@@ -578,6 +614,46 @@ class TestDocumentSearchApi(DirectoriesMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, [b"apples", b"applebaum", b"appletini"])
 
+    @mock.patch("documents.index.autocomplete")
+    def test_search_autocomplete_cached(self, m):
+        """
+        GIVEN:
+            - Autocomplete terms have been requested once
+        WHEN:
+            - The same autocomplete request is made again
+            - The index is updated and the request is made again
+        THEN:
+            - The cached terms are returned without searching the index
+            - The index is searched again after the update
+        """
+        m.side_effect = lambda ix, term, limit, user: [term.encode()]
+
+        response = self.client.get("/api/search/autocomplete/?term=test")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [b"test"])
+        self.assertEqual(m.call_count, 1)
+
+        response = self.client.get("/api/search/autocomplete/?term=test")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [b"test"])
+        self.assertEqual(m.call_count, 1)
+
+        response = self.client.get("/api/search/autocomplete/?term=test&limit=5")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(m.call_count, 2)
+
+        d1 = Document.objects.create(
+            title="doc1",
+            content="test",
+            checksum="1",
+        )
+        with AsyncWriter(index.open_index()) as writer:
+            index.update_document(writer, d1)
+
+        response = self.client.get("/api/search/autocomplete/?term=test")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(m.call_count, 3)
+
     def test_search_autocomplete_field_name_match(self):
         """
         GIVEN:
@@ -1071,6 +1147,37 @@ class TestDocumentSearchApi(DirectoriesMixin, APITestCase):
         r = self.client.get(f"/api/documents/?query=test&shared_by__id={u1.id}")
         self.assertEqual(r.data["count"], 1)
 
+    def test_search_user_can_change_with_object_perms(self):
+        """
+        GIVEN:
+            - Documents owned by another user, one with granted change permissions
+        WHEN:
+            - API request for advanced query (search) is made by user
+        THEN:
+            - user_can_change reflects the granted object permissions per result
+        """
+        u1 = User.objects.create_user("user1")
+        u2 = User.objects.create_user("user2")
+        u1.user_permissions.add(*Permission.objects.filter(codename="view_document"))
+
+        d1 = Document.objects.create(checksum="1", content="test 1", owner=u2)
+        d2 = Document.objects.create(checksum="2", content="test 2", owner=u2)
+        d3 = Document.objects.create(checksum="3", content="test 3", owner=u1)
+
+        assign_perm("view_document", u1, d1)
+        assign_perm("view_document", u1, d2)
+        assign_perm("change_document", u1, d2)
+
+        with AsyncWriter(index.open_index()) as writer:
+            for doc in Document.objects.all():
+                index.update_document(writer, doc)
+
+        self.client.force_authenticate(user=u1)
+        r = self.client.get("/api/documents/?query=test")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        can_change = {doc["id"]: doc["user_can_change"] for doc in r.data["results"]}
+        self.assertDictEqual(can_change, {d1.id: False, d2.id: True, d3.id: True})
+
     def test_search_sorting(self):
         u1 = User.objects.create_user("user1")
         u2 = User.objects.create_user("user2")
@@ -1280,6 +1387,29 @@ class TestDocumentSearchApi(DirectoriesMixin, APITestCase):
         self.assertEqual(results["custom_fields"][0]["id"], custom_field1.id)
         self.assertEqual(results["workflows"][0]["id"], workflow1.id)
 
+    @mock.patch("documents.index.open_index_searcher")
+    def test_global_search_enough_title_matches(self, mock_searcher):
+        """
+        GIVEN:
+            - More documents matching the query by title than are returned
+        WHEN:
+            - Global search query is made
+        THEN:
+            - The full text index is not searched
+            - Only the returned number of documents is listed
+        """
+        for i in range(5):
+            Document.objects.create(
+                title=f"invoice {i}",
+                content="content",
+                checksum=str(i),
+            )
+
+        response = self.client.get("/api/search/?query=invoice")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["documents"]), 3)
+        mock_searcher.assert_not_called()
+
     def test_global_search_bad_request(self):
         """
         WHEN:
@@ -1,5 +1,6 @@
 import json
 
+from django.contrib.auth.models import Group
 from django.contrib.auth.models import Permission
 from django.contrib.auth.models import User
 from django.test import override_settings
@@ -48,6 +49,35 @@ class TestApiUiSettings(DirectoriesMixin, APITestCase):
             },
         )
 
+    def test_api_get_ui_settings_user_permissions(self):
+        """
+        GIVEN:
+            - A user with a group and global permissions
+        WHEN:
+            - UI settings are requested
+        THEN:
+            - The group ids are returned
+            - Permissions are returned without their app label
+        """
+        user = User.objects.create_user(username="test_perms")
+        group = Group.objects.create(name="group1")
+        user.groups.add(group)
+        user.user_permissions.add(
+            *Permission.objects.filter(
+                codename__in=["view_uisettings", "view_document"],
+            ),
+        )
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get(self.ENDPOINT, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user"]["groups"], [group.id])
+        self.assertCountEqual(
+            response.data["permissions"],
+            ["view_uisettings", "view_document"],
+        )
+
     def test_api_set_ui_settings(self):
         settings = {
             "settings": {
@@ -209,6 +209,12 @@ class CopyParser(_BaseTestParser):
         shutil.copy(document_path, self.archive_path)
 
 
+class NoTextParser(DummyParser):
+    def parse(self, document_path, mime_type, file_name=None):
+        self.text = None
+        self.date = timezone.now()
+
+
 class FaultyParser(_BaseTestParser):
     def __init__(self, logging_group, scratch_dir):
         super().__init__(logging_group)
@@ -285,6 +291,13 @@ class TestConsumer(
             self.get_test_archive_file(),
         )
 
+    def make_no_text_parser(self, logging_group, progress_callback=None):
+        return NoTextParser(
+            logging_group,
+            self.dirs.scratch_dir,
+            self.get_test_archive_file(),
+        )
+
     def make_faulty_parser(self, logging_group, progress_callback=None):
         return FaultyParser(logging_group, self.dirs.scratch_dir)
 
@@ -397,6 +410,23 @@ class TestConsumer(
         self.assertEqual(document_date_local.minute, rough_create_date_local.minute)
         # Skipping seconds and more precise
 
+    @mock.patch("documents.consumer.detect_language", return_value="en")
+    def testLanguageDetected(self, m):
+        """
+        GIVEN:
+            - A document to consume
+        WHEN:
+            - The document is consumed
+        THEN:
+            - The language is detected from the parsed text and stored
+        """
+        with self.get_consumer(self.get_test_file()) as consumer:
+            consumer.run()
+
+        document = Document.objects.first()
+        self.assertEqual(document.language, "en")
+        m.assert_called_once_with("The Text")
+
     @override_settings(FILENAME_FORMAT=None)
     def testDeleteMacFiles(self):
         # https://github.com/jonaswinkler/paperless-ng/discussions/1037
@@ -732,6 +762,37 @@ class TestConsumer(
 
         self._assert_first_last_send_progress(last_status="FAILED")
 
+    @mock.patch("documents.parsers.document_consumer_declaration.send")
+    def testParserNoText(self, m):
+        """
+        GIVEN:
+            - A parser which could not extract any text
+        WHEN:
+            - The document is consumed
+        THEN:
+            - Language detection does not fail on the missing text
+            - Consumption fails when storing the document, with cleanup
+        """
+        m.return_value = [
+            (
+                None,
+                {
+                    "parser": self.make_no_text_parser,
+                    "mime_types": {"application/pdf": ".pdf"},
+                    "weight": 0,
+                },
+            ),
+        ]
+
+        with self.get_consumer(self.get_test_file()) as consumer:
+            with self.assertRaisesMessage(
+                ConsumerError,
+                "error occurred while storing document sample.pdf after parsing",
+            ):
+                consumer.run()
+
+        self._assert_first_last_send_progress(last_status="FAILED")
+
     @mock.patch("documents.parsers.document_consumer_declaration.send")
     def testGenericParserException(self, m):
         m.return_value = [
@@ -184,3 +184,31 @@ class TestEmptyTrashTask(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
 
         tasks.empty_trash()
         self.assertEqual(Document.global_objects.count(), 0)
+
+
+class TestCleanupBulkDownloadsTask(DirectoriesMixin, FileSystemAssertsMixin, TestCase):
+    def test_cleanup_bulk_downloads(self):
+        """
+        GIVEN:
+            - A bulk download which was not collected in time
+            - A recent bulk download
+            - Another file in the scratch directory
+        WHEN:
+            - The bulk download cleanup task runs
+        THEN:
+            - Only the expired bulk download is removed
+        """
+        expired = settings.SCRATCH_DIR / "abc-compressed-archive"
+        recent = settings.SCRATCH_DIR / "def-compressed-archive"
+        other = settings.SCRATCH_DIR / "other.pdf"
+        for path in (expired, recent, other):
+            path.touch()
+        old = (timezone.now() - timedelta(hours=1)).timestamp()
+        os.utime(expired, (old, old))
+        os.utime(other, (old, old))
+
+        tasks.cleanup_bulk_downloads()
+
+        self.assertIsNotFile(expired)
+        self.assertIsFile(recent)
+        self.assertIsFile(other)
@@ -116,7 +116,7 @@ class TestViews(DirectoriesMixin, TestCase):
         # Valid
         response = self.client.get(f"/share/{sl1.slug}")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.content, content)
+        self.assertEqual(response.getvalue(), content)
 
         # Invalid
         response = self.client.get("/share/123notaslug", follow=True)
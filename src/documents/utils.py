@@ -6,6 +6,8 @@ from subprocess import CompletedProcess
 from subprocess import run
 
 from django.conf import settings
+from langdetect import detect
+from langdetect.lang_detect_exception import LangDetectException
 from PIL import Image
 
 
@@ -108,3 +110,23 @@ def run_subprocess(
         completed_proc.check_returncode()
 
     return completed_proc
+
+
+def detect_language(content: str | None) -> str:
+    """
+    Returns the language code detected from the given text, or an empty string
+    if no language could be detected
+    """
+    if not content:
+        return ""
+    try:
+        return detect(content)
+    except LangDetectException:
+        return ""
+
+
+def get_boolean_query_param(request, key: str) -> bool:
+    """
+    Returns True if the given query parameter is set to true or 1, in any case
+    """
+    return request.query_params.get(key, "").lower() in ("true", "1")
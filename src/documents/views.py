@@ -6,10 +6,10 @@ import platform
 import re
 import tempfile
 import urllib
-import zipfile
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from time import mktime
 from unicodedata import normalize
 from urllib.parse import quote
 from urllib.parse import urlparse
@@ -19,23 +19,23 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import Group
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import connections
 from django.db.migrations.loader import MigrationLoader
 from django.db.migrations.recorder import MigrationRecorder
-from django.db.models import Case
 from django.db.models import Count
-from django.db.models import IntegerField
 from django.db.models import Max
 from django.db.models import Q
 from django.db.models import Sum
-from django.db.models import When
 from django.db.models.functions import Length
 from django.db.models.functions import Lower
+from django.http import FileResponse
 from django.http import Http404
 from django.http import HttpResponse
 from django.http import HttpResponseBadRequest
 from django.http import HttpResponseForbidden
 from django.http import HttpResponseRedirect
+from django.http import HttpResponseServerError
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -47,7 +47,6 @@ from django.views.decorators.http import condition
 from django.views.decorators.http import last_modified
 from django.views.generic import TemplateView
 from django_filters.rest_framework import DjangoFilterBackend
-from langdetect import detect
 from packaging import version as packaging_version
 from redis import Redis
 from rest_framework import parsers
@@ -70,15 +69,20 @@ from rest_framework.viewsets import ViewSet
 
 from documents import bulk_edit
 from documents import index
-from documents.bulk_download import ArchiveOnlyStrategy
-from documents.bulk_download import OriginalAndArchiveStrategy
-from documents.bulk_download import OriginalsOnlyStrategy
+from documents.bulk_download import BULK_DOWNLOAD_SUFFIX
+from documents.bulk_download import write_bulk_archive
+from documents.caching import CACHE_5_MINUTES
 from documents.caching import CACHE_50_MINUTES
+from documents.caching import REMOTE_VERSION_KEY
+from documents.caching import get_autocomplete_cache_key
+from documents.caching import get_bulk_download_cache_key
 from documents.caching import get_metadata_cache
+from documents.caching import get_suggested_dates_cache
 from documents.caching import get_suggestion_cache
 from documents.caching import refresh_metadata_cache
 from documents.caching import refresh_suggestions_cache
 from documents.caching import set_metadata_cache
+from documents.caching import set_suggested_dates_cache
 from documents.caching import set_suggestions_cache
 from documents.classifier import load_classifier
 from documents.conditionals import metadata_etag
@@ -150,9 +154,12 @@ from documents.serialisers import WorkflowActionSerializer
 from documents.serialisers import WorkflowSerializer
 from documents.serialisers import WorkflowTriggerSerializer
 from documents.signals import document_updated
+from documents.tasks import build_bulk_download
 from documents.tasks import consume_file
 from documents.tasks import empty_trash
 from documents.templating.filepath import validate_filepath_template_and_render
+from documents.utils import detect_language
+from documents.utils import get_boolean_query_param
 from paperless import version
 from paperless.celery import app as celery_app
 from paperless.config import GeneralConfig
@@ -171,6 +178,23 @@ if settings.AUDIT_LOG_ENABLED:
 
 logger = logging.getLogger("paperless.api")
 
+# matches the <app_label>. prefix of a permission string
+APP_LABEL_PREFIX_RE = re.compile(r"^\w+\.")
+
+REMOTE_VERSION_URL = (
+    "https://api.github.com/repos/paperless-ngx/paperless-ngx/releases/latest"
+)
+CURRENT_VERSION = packaging_version.parse(version.__full_version_str__)
+
+
+@lru_cache(maxsize=64)
+def _get_metadata_parser_class(mime_type: str):
+    """
+    Parsers are declared once at app startup, so the lookup for a given
+    mime type never changes while the process is running
+    """
+    return get_parser_class_for_mime_type(mime_type)
+
 
 class IndexView(TemplateView):
     template_name = "index.html"
@@ -188,8 +212,7 @@ class IndexView(TemplateView):
         # However, angular generates locales as "en-US".
         # this translates between these two forms.
         if "-" in lang:
-            first = lang[: lang.index("-")]
-            second = lang[lang.index("-") + 1 :]
+            first, _, second = lang.partition("-")
             return f"{first}-{second.upper()}"
         else:
             return lang
@@ -199,18 +222,13 @@ class IndexView(TemplateView):
         context["cookie_prefix"] = settings.COOKIE_PREFIX
         context["username"] = self.request.user.username
         context["full_name"] = self.request.user.get_full_name()
-        context["styles_css"] = f"frontend/{self.get_frontend_language()}/styles.css"
-        context["runtime_js"] = f"frontend/{self.get_frontend_language()}/runtime.js"
-        context["polyfills_js"] = (
-            f"frontend/{self.get_frontend_language()}/polyfills.js"
-        )
-        context["main_js"] = f"frontend/{self.get_frontend_language()}/main.js"
-        context["webmanifest"] = (
-            f"frontend/{self.get_frontend_language()}/manifest.webmanifest"
-        )
-        context["apple_touch_icon"] = (
-            f"frontend/{self.get_frontend_language()}/apple-touch-icon.png"
-        )
+        lang = self.get_frontend_language()
+        context["styles_css"] = f"frontend/{lang}/styles.css"
+        context["runtime_js"] = f"frontend/{lang}/runtime.js"
+        context["polyfills_js"] = f"frontend/{lang}/polyfills.js"
+        context["main_js"] = f"frontend/{lang}/main.js"
+        context["webmanifest"] = f"frontend/{lang}/manifest.webmanifest"
+        context["apple_touch_icon"] = f"frontend/{lang}/apple-touch-icon.png"
         return context
 
 
@@ -223,7 +241,7 @@ class PassUserMixin(GenericAPIView):
         kwargs.setdefault("user", self.request.user)
         kwargs.setdefault(
             "full_perms",
-            self.request.query_params.get("full_perms", False),
+            get_boolean_query_param(self.request, "full_perms"),
         )
         return super().get_serializer(*args, **kwargs)
 
@@ -369,23 +387,26 @@ class DocumentViewSet(
 
     def get_queryset(self):
         return (
-            Document.objects.distinct()
-            .order_by("-created")
-            .annotate(num_notes=Count("notes"))
+            # The notes count groups the rows by document, so filters joining
+            # multi-valued relations cannot return a document twice
+            Document.objects.order_by("-created")
+            .annotate(num_notes=Count("notes", distinct=True))
             .select_related("correspondent", "storage_path", "document_type", "owner")
-            .prefetch_related("tags", "custom_fields", "notes")
+            .prefetch_related("tags", "custom_fields__field", "notes")
         )
 
     def get_serializer(self, *args, **kwargs):
         fields_param = self.request.query_params.get("fields", None)
         fields = fields_param.split(",") if fields_param else None
-        truncate_content = self.request.query_params.get("truncate_content", "False")
         kwargs.setdefault("context", self.get_serializer_context())
         kwargs.setdefault("fields", fields)
-        kwargs.setdefault("truncate_content", truncate_content.lower() in ["true", "1"])
+        kwargs.setdefault(
+            "truncate_content",
+            get_boolean_query_param(self.request, "truncate_content"),
+        )
         kwargs.setdefault(
             "full_perms",
-            self.request.query_params.get("full_perms", False),
+            get_boolean_query_param(self.request, "full_perms"),
         )
         return super().get_serializer(*args, **kwargs)
 
@@ -410,13 +431,15 @@ class DocumentViewSet(
 
     @staticmethod
     def original_requested(request):
-        return (
-            "original" in request.query_params
-            and request.query_params["original"] == "true"
-        )
+        return get_boolean_query_param(request, "original")
 
     def file_response(self, pk, request, disposition):
-        doc = Document.objects.select_related("owner").get(id=pk)
+        doc = get_object_or_404(
+            Document.objects.select_related("owner", "correspondent").defer(
+                "content",
+            ),
+            pk=pk,
+        )
         if request.user is not None and not has_perms_owner_aware(
             request.user,
             "view_document",
@@ -434,7 +457,7 @@ class DocumentViewSet(
         if not os.path.isfile(file):
             return None
 
-        parser_class = get_parser_class_for_mime_type(mime_type)
+        parser_class = _get_metadata_parser_class(mime_type)
         if parser_class:
             parser = parser_class(progress_callback=None, logging_group=None)
 
@@ -459,16 +482,27 @@ class DocumentViewSet(
         condition(etag_func=metadata_etag, last_modified_func=metadata_last_modified),
     )
     def metadata(self, request, pk=None):
-        try:
-            doc = Document.objects.select_related("owner").get(pk=pk)
-            if request.user is not None and not has_perms_owner_aware(
-                request.user,
-                "view_document",
-                doc,
-            ):
-                return HttpResponseForbidden("Insufficient permissions")
-        except Document.DoesNotExist:
-            raise Http404
+        doc = get_object_or_404(
+            Document.objects.select_related("owner").only(
+                "pk",
+                "owner",
+                "checksum",
+                "mime_type",
+                "filename",
+                "archive_checksum",
+                "archive_filename",
+                "original_filename",
+                "language",
+                "storage_type",
+            ),
+            pk=pk,
+        )
+        if request.user is not None and not has_perms_owner_aware(
+            request.user,
+            "view_document",
+            doc,
+        ):
+            return HttpResponseForbidden("Insufficient permissions")
 
         document_cached_metadata = get_metadata_cache(doc.pk)
 
@@ -503,12 +537,12 @@ class DocumentViewSet(
             "archive_metadata": archive_metadata,
         }
 
-        lang = "en"
-        try:
-            lang = detect(doc.content)
-        except Exception:
-            pass
-        meta["lang"] = lang
+        if doc.language is None:
+            # Documents consumed before the language was stored, or whose
+            # content was edited since
+            doc.language = detect_language(doc.content)
+            Document.objects.filter(pk=doc.pk).update(language=doc.language)
+        meta["lang"] = doc.language or "en"
 
         return Response(meta)
 
@@ -538,10 +572,23 @@ class DocumentViewSet(
 
         dates = []
         if settings.NUMBER_OF_SUGGESTED_DATES > 0:
-            gen = parse_date_generator(doc.filename, doc.content)
-            dates = sorted(
-                {i for i in itertools.islice(gen, settings.NUMBER_OF_SUGGESTED_DATES)},
-            )
+            dates = get_suggested_dates_cache(doc)
+            if dates is None:
+                gen = parse_date_generator(doc.filename, doc.content)
+                dates = [
+                    date.strftime("%Y-%m-%d")
+                    for date in sorted(
+                        {
+                            i
+                            for i in itertools.islice(
+                                gen,
+                                settings.NUMBER_OF_SUGGESTED_DATES,
+                            )
+                        },
+                    )
+                    if date is not None
+                ]
+                set_suggested_dates_cache(doc, dates)
 
         resp_data = {
             "correspondents": [
@@ -554,7 +601,7 @@ class DocumentViewSet(
             "storage_paths": [
                 dt.id for dt in match_storage_paths(doc, classifier, request.user)
             ],
-            "dates": [date.strftime("%Y-%m-%d") for date in dates if date is not None],
+            "dates": dates,
         }
 
         # Cache the suggestions and the classifier hash for later
@@ -571,52 +618,61 @@ class DocumentViewSet(
         try:
             response = self.file_response(pk, request, "inline")
             return response
-        except (FileNotFoundError, Document.DoesNotExist):
+        except FileNotFoundError:
             raise Http404
 
     @action(methods=["get"], detail=True)
     @method_decorator(cache_control(public=False, max_age=CACHE_50_MINUTES))
     @method_decorator(last_modified(thumbnail_last_modified))
     def thumb(self, request, pk=None):
+        doc = get_object_or_404(
+            Document.objects.select_related("owner").only(
+                "pk",
+                "owner",
+                "storage_type",
+            ),
+            pk=pk,
+        )
+        if request.user is not None and not has_perms_owner_aware(
+            request.user,
+            "view_document",
+            doc,
+        ):
+            return HttpResponseForbidden("Insufficient permissions")
         try:
-            doc = Document.objects.select_related("owner").get(id=pk)
-            if request.user is not None and not has_perms_owner_aware(
-                request.user,
-                "view_document",
-                doc,
-            ):
-                return HttpResponseForbidden("Insufficient permissions")
             if doc.storage_type == Document.STORAGE_TYPE_GPG:
-                handle = GnuPG.decrypted(doc.thumbnail_file)
-            else:
-                handle = doc.thumbnail_file
+                return HttpResponse(
+                    GnuPG.decrypted(doc.thumbnail_file),
+                    content_type="image/webp",
+                )
 
-            return HttpResponse(handle, content_type="image/webp")
-        except (FileNotFoundError, Document.DoesNotExist):
+            return FileResponse(doc.thumbnail_file, content_type="image/webp")
+        except FileNotFoundError:
             raise Http404
 
     @action(methods=["get"], detail=True)
     def download(self, request, pk=None):
         try:
             return self.file_response(pk, request, "attachment")
-        except (FileNotFoundError, Document.DoesNotExist):
+        except FileNotFoundError:
             raise Http404
 
     def getNotes(self, doc):
         return [
             {
-                "id": c.pk,
-                "note": c.note,
-                "created": c.created,
+                "id": note["pk"],
+                "note": note["note"],
+                "created": note["created"],
                 "user": {
-                    "id": c.user.id,
-                    "username": c.user.username,
-                    "first_name": c.user.first_name,
-                    "last_name": c.user.last_name,
+                    "id": note["user__id"],
+                    "username": note["user__username"],
+                    "first_name": note["user__first_name"],
+                    "last_name": note["user__last_name"],
                 },
             }
-            for c in Note.objects.select_related("user")
-            .only(
+            for note in Note.objects.filter(document=doc)
+            .order_by("-created")
+            .values(
                 "pk",
                 "note",
                 "created",
@@ -625,8 +681,7 @@ class DocumentViewSet(
                 "user__first_name",
                 "user__last_name",
             )
-            .filter(document=doc)
-            .order_by("-created")
+            .iterator(chunk_size=200)
         ]
 
     @action(
@@ -636,21 +691,16 @@ class DocumentViewSet(
     )
     def notes(self, request, pk=None):
         currentUser = request.user
-        try:
-            doc = (
-                Document.objects.select_related("owner")
-                .prefetch_related("notes")
-                .only("pk", "owner__id")
-                .get(pk=pk)
-            )
-            if currentUser is not None and not has_perms_owner_aware(
-                currentUser,
-                "view_document",
-                doc,
-            ):
-                return HttpResponseForbidden("Insufficient permissions to view notes")
-        except Document.DoesNotExist:
-            raise Http404
+        doc = get_object_or_404(
+            Document.objects.select_related("owner").only("pk", "owner__id"),
+            pk=pk,
+        )
+        if currentUser is not None and not has_perms_owner_aware(
+            currentUser,
+            "view_document",
+            doc,
+        ):
+            return HttpResponseForbidden("Insufficient permissions to view notes")
 
         if request.method == "GET":
             try:
@@ -688,12 +738,12 @@ class DocumentViewSet(
                         action=LogEntry.Action.UPDATE,
                     )
 
-                doc.modified = timezone.now()
-                doc.save()
+                # Only the timestamp changes, the file handling signals are not needed
+                Document.objects.filter(pk=doc.pk).update(modified=timezone.now())
 
                 from documents import index
 
-                index.add_or_update_document(doc)
+                index.add_or_update_document_by_id(doc.pk)
 
                 notes = self.getNotes(doc)
 
@@ -725,12 +775,12 @@ class DocumentViewSet(
 
             note.delete()
 
-            doc.modified = timezone.now()
-            doc.save()
+            # Only the timestamp changes, the file handling signals are not needed
+            Document.objects.filter(pk=doc.pk).update(modified=timezone.now())
 
             from documents import index
 
-            index.add_or_update_document(doc)
+            index.add_or_update_document_by_id(doc.pk)
 
             return Response(self.getNotes(doc))
 
@@ -758,19 +808,13 @@ class DocumentViewSet(
 
         if request.method == "GET":
             now = timezone.now()
-            links = [
-                {
-                    "id": c.pk,
-                    "created": c.created,
-                    "expiration": c.expiration,
-                    "slug": c.slug,
-                }
-                for c in ShareLink.objects.filter(document=doc)
-                .only("pk", "created", "expiration", "slug")
+            links = (
+                ShareLink.objects.filter(document=doc)
                 .exclude(expiration__lt=now)
                 .order_by("-created")
-            ]
-            return Response(links)
+                .values("id", "created", "expiration", "slug")
+            )
+            return Response(list(links))
 
     @action(methods=["get"], detail=True, name="Audit Trail")
     def history(self, request, pk=None):
@@ -918,10 +962,19 @@ class LogViewSet(ViewSet):
         if not os.path.isfile(filename):
             raise Http404
 
-        with open(filename) as f:
-            lines = [line.rstrip() for line in f.readlines()]
+        limit = None
+        if "limit" in request.query_params:
+            try:
+                limit = int(request.query_params["limit"])
+            except ValueError:
+                return HttpResponseBadRequest("Invalid limit")
+            if limit <= 0:
+                return HttpResponseBadRequest("Invalid limit")
 
-        return Response(lines)
+        with open(filename) as f:
+            # Only keep the requested tail in memory while reading
+            lines = deque(f, maxlen=limit) if limit is not None else f
+            return Response([line.rstrip() for line in lines])
 
     def list(self, request, *args, **kwargs):
         exist = [
@@ -1032,18 +1085,15 @@ class PostDocumentView(GenericAPIView):
         archive_serial_number = serializer.validated_data.get("archive_serial_number")
         custom_field_ids = serializer.validated_data.get("custom_fields")
 
-        t = int(mktime(datetime.now().timetuple()))
-
         settings.SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
 
         temp_file_path = Path(tempfile.mkdtemp(dir=settings.SCRATCH_DIR)) / Path(
             pathvalidate.sanitize_filename(doc_name),
         )
 
+        # A freshly written file is already stamped with the upload time
         temp_file_path.write_bytes(doc_data)
 
-        os.utime(temp_file_path, times=(t, t))
-
         input_doc = ConsumableDocument(
             source=DocumentSource.ApiUpload,
             original_file=temp_file_path,
@@ -1074,68 +1124,57 @@ class SelectionDataView(GenericAPIView):
     serializer_class = DocumentListSerializer
     parser_classes = (parsers.MultiPartParser, parsers.JSONParser)
 
+    @staticmethod
+    def get_document_counts(queryset, document_lookup, ids):
+        """
+        Counts the selected documents for every object in the queryset.  Only
+        rows joined to the selection are aggregated, objects without any
+        selected document are filled in with a count of 0
+        """
+        counts = dict(
+            queryset.filter(**{f"{document_lookup}__id__in": ids})
+            .order_by()
+            .values_list("id")
+            .annotate(Count(document_lookup)),
+        )
+        return [
+            {"id": pk, "document_count": counts.get(pk, 0)}
+            for pk in queryset.values_list("id", flat=True)
+        ]
+
     def post(self, request, format=None):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         ids = serializer.validated_data.get("documents")
 
-        correspondents = Correspondent.objects.annotate(
-            document_count=Count(
-                Case(When(documents__id__in=ids, then=1), output_field=IntegerField()),
-            ),
-        )
-
-        tags = Tag.objects.annotate(
-            document_count=Count(
-                Case(When(documents__id__in=ids, then=1), output_field=IntegerField()),
-            ),
-        )
-
-        types = DocumentType.objects.annotate(
-            document_count=Count(
-                Case(When(documents__id__in=ids, then=1), output_field=IntegerField()),
-            ),
-        )
-
-        storage_paths = StoragePath.objects.annotate(
-            document_count=Count(
-                Case(When(documents__id__in=ids, then=1), output_field=IntegerField()),
-            ),
-        )
-
-        custom_fields = CustomField.objects.annotate(
-            document_count=Count(
-                Case(
-                    When(
-                        fields__document__id__in=ids,
-                        then=1,
-                    ),
-                    output_field=IntegerField(),
-                ),
-            ),
-        )
-
         r = Response(
             {
-                "selected_correspondents": [
-                    {"id": t.id, "document_count": t.document_count}
-                    for t in correspondents
-                ],
-                "selected_tags": [
-                    {"id": t.id, "document_count": t.document_count} for t in tags
-                ],
-                "selected_document_types": [
-                    {"id": t.id, "document_count": t.document_count} for t in types
-                ],
-                "selected_storage_paths": [
-                    {"id": t.id, "document_count": t.document_count}
-                    for t in storage_paths
-                ],
-                "selected_custom_fields": [
-                    {"id": t.id, "document_count": t.document_count}
-                    for t in custom_fields
-                ],
+                "selected_correspondents": self.get_document_counts(
+                    Correspondent.objects.all(),
+                    "documents",
+                    ids,
+                ),
+                "selected_tags": self.get_document_counts(
+                    Tag.objects.all(),
+                    "documents",
+                    ids,
+                ),
+                "selected_document_types": self.get_document_counts(
+                    DocumentType.objects.all(),
+                    "documents",
+                    ids,
+                ),
+                "selected_storage_paths": self.get_document_counts(
+                    StoragePath.objects.all(),
+                    "documents",
+                    ids,
+                ),
+                "selected_custom_fields": self.get_document_counts(
+                    CustomField.objects.all(),
+                    "fields__document",
+                    ids,
+                ),
             },
         )
 
@@ -1164,14 +1203,23 @@ class SearchAutoCompleteView(APIView):
 
         ix = index.open_index()
 
-        return Response(
-            index.autocomplete(
+        cache_key = get_autocomplete_cache_key(
+            ix.latest_generation(),
+            user,
+            term,
+            limit,
+        )
+        terms = cache.get(cache_key)
+        if terms is None:
+            terms = index.autocomplete(
                 ix,
                 term,
                 limit,
                 user,
-            ),
-        )
+            )
+            cache.set(cache_key, terms, CACHE_5_MINUTES)
+
+        return Response(terms)
 
 
 class GlobalSearchView(PassUserMixin):
@@ -1197,7 +1245,7 @@ class GlobalSearchView(PassUserMixin):
             )
             # First search by title
             docs = all_docs.filter(title__icontains=query)
-            if not db_only and len(docs) < OBJECT_LIMIT:
+            if not db_only and docs[:OBJECT_LIMIT].count() < OBJECT_LIMIT:
                 # If we don't have enough results, search by content
                 from documents import index
 
@@ -1212,7 +1260,12 @@ class GlobalSearchView(PassUserMixin):
                     docs = docs | Document.objects.filter(
                         id__in=[r["id"] for r in results],
                     )
-            docs = docs[:OBJECT_LIMIT]
+            docs = docs.select_related(
+                "correspondent",
+                "storage_path",
+                "document_type",
+                "owner",
+            ).prefetch_related("tags", "custom_fields__field", "notes")[:OBJECT_LIMIT]
         saved_views = (
             SavedView.objects.filter(owner=request.user, name__icontains=query)
             if request.user.has_perm("documents.view_savedview")
@@ -1339,32 +1392,27 @@ class GlobalSearchView(PassUserMixin):
             context=context,
         )
 
+        results = {
+            "documents": docs_serializer.data,
+            "saved_views": saved_views_serializer.data,
+            "tags": tags_serializer.data,
+            "correspondents": correspondents_serializer.data,
+            "document_types": document_types_serializer.data,
+            "storage_paths": storage_paths_serializer.data,
+            "users": users_serializer.data,
+            "groups": groups_serializer.data,
+            "mail_rules": mail_rules_serializer.data,
+            "mail_accounts": mail_accounts_serializer.data,
+            "workflows": workflows_serializer.data,
+            "custom_fields": custom_fields_serializer.data,
+        }
+
         return Response(
             {
-                "total": len(docs)
-                + len(saved_views)
-                + len(tags)
-                + len(correspondents)
-                + len(document_types)
-                + len(storage_paths)
-                + len(users)
-                + len(groups)
-                + len(mail_rules)
-                + len(mail_accounts)
-                + len(workflows)
-                + len(custom_fields),
-                "documents": docs_serializer.data,
-                "saved_views": saved_views_serializer.data,
-                "tags": tags_serializer.data,
-                "correspondents": correspondents_serializer.data,
-                "document_types": document_types_serializer.data,
-                "storage_paths": storage_paths_serializer.data,
-                "users": users_serializer.data,
-                "groups": groups_serializer.data,
-                "mail_rules": mail_rules_serializer.data,
-                "mail_accounts": mail_accounts_serializer.data,
-                "workflows": workflows_serializer.data,
-                "custom_fields": custom_fields_serializer.data,
+                # counted from the serialized results, which are limited
+                # already, so no separate count queries are needed
+                "total": sum(len(objects) for objects in results.values()),
+                **results,
             },
         )
 
@@ -1376,17 +1424,13 @@ class StatisticsView(APIView):
         user = request.user if request.user is not None else None
 
         documents = (
-            (
-                Document.objects.all()
-                if user is None
-                else get_objects_for_user_owner_aware(
-                    user,
-                    "documents.view_document",
-                    Document,
-                )
+            Document.objects.all()
+            if user is None
+            else get_objects_for_user_owner_aware(
+                user,
+                "documents.view_document",
+                Document,
             )
-            .only("mime_type", "content")
-            .prefetch_related("tags")
         )
         tags = (
             Tag.objects.all()
@@ -1421,16 +1465,29 @@ class StatisticsView(APIView):
             ).count()
         )
 
-        documents_total = documents.count()
-
-        inbox_tags = tags.filter(is_inbox_tag=True)
-
-        documents_inbox = (
-            documents.filter(tags__id__in=inbox_tags).distinct().count()
-            if inbox_tags.exists()
-            else None
+        inbox_tag_ids = list(
+            tags.filter(is_inbox_tag=True).values_list("pk", flat=True),
         )
 
+        aggregates = {
+            "documents_total": Count("id"),
+            "character_count": Sum(Length("content")),
+        }
+        if inbox_tag_ids:
+            # Filter through a subquery instead of joining tags, which would
+            # duplicate rows and skew the character count
+            aggregates["documents_inbox"] = Count(
+                "id",
+                filter=Q(
+                    id__in=Document.tags.through.objects.filter(
+                        tag_id__in=inbox_tag_ids,
+                    ).values("document_id"),
+                ),
+            )
+        document_totals = documents.aggregate(**aggregates)
+        documents_total = document_totals["documents_total"]
+        documents_inbox = document_totals.get("documents_inbox")
+
         document_file_type_counts = (
             documents.values("mime_type")
             .annotate(mime_type_count=Count("mime_type"))
@@ -1439,14 +1496,6 @@ class StatisticsView(APIView):
             else []
         )
 
-        character_count = (
-            documents.annotate(
-                characters=Length("content"),
-            )
-            .aggregate(Sum("characters"))
-            .get("characters__sum")
-        )
-
         current_asn = Document.objects.aggregate(
             Max("archive_serial_number", default=0),
         ).get(
@@ -1458,14 +1507,12 @@ class StatisticsView(APIView):
                 "documents_total": documents_total,
                 "documents_inbox": documents_inbox,
                 "inbox_tag": (
-                    inbox_tags.first().pk if inbox_tags.exists() else None
+                    inbox_tag_ids[0] if inbox_tag_ids else None
                 ),  # backwards compatibility
-                "inbox_tags": (
-                    [tag.pk for tag in inbox_tags] if inbox_tags.exists() else None
-                ),
+                "inbox_tags": inbox_tag_ids if inbox_tag_ids else None,
                 "document_file_type_counts": document_file_type_counts,
-                "character_count": character_count,
-                "tag_count": len(tags),
+                "character_count": document_totals["character_count"],
+                "tag_count": tags.count(),
                 "correspondent_count": correspondent_count,
                 "document_type_count": document_type_count,
                 "storage_path_count": storage_path_count,
@@ -1488,33 +1535,72 @@ class BulkDownloadView(GenericAPIView):
         content = serializer.validated_data.get("content")
         follow_filename_format = serializer.validated_data.get("follow_formatting")
 
+        if serializer.validated_data.get("background"):
+            async_task = build_bulk_download.delay(
+                document_ids=ids,
+                compression=compression,
+                content=content,
+                follow_formatting=follow_filename_format,
+            )
+            cache.set(
+                get_bulk_download_cache_key(async_task.id),
+                request.user.id,
+                CACHE_50_MINUTES,
+            )
+            return Response({"task_id": async_task.id})
+
         settings.SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
+        # Removed once the response has been sent and closes it
         temp = tempfile.NamedTemporaryFile(
             dir=settings.SCRATCH_DIR,
-            suffix="-compressed-archive",
-            delete=False,
+            suffix=BULK_DOWNLOAD_SUFFIX,
         )
 
-        if content == "both":
-            strategy_class = OriginalAndArchiveStrategy
-        elif content == "originals":
-            strategy_class = OriginalsOnlyStrategy
-        else:
-            strategy_class = ArchiveOnlyStrategy
-
-        with zipfile.ZipFile(temp.name, "w", compression) as zipf:
-            strategy = strategy_class(zipf, follow_filename_format)
-            for document in Document.objects.filter(pk__in=ids):
-                strategy.add_document(document)
-
-        with open(temp.name, "rb") as f:
-            response = HttpResponse(f, content_type="application/zip")
-            response["Content-Disposition"] = '{}; filename="{}"'.format(
-                "attachment",
-                "documents.zip",
-            )
+        write_bulk_archive(temp, ids, compression, content, follow_filename_format)
 
-            return response
+        temp.seek(0)
+
+        return FileResponse(
+            temp,
+            as_attachment=True,
+            filename="documents.zip",
+            content_type="application/zip",
+        )
+
+
+class BulkDownloadResultView(GenericAPIView):
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, task_id, format=None):
+        cache_key = get_bulk_download_cache_key(task_id)
+        if cache.get(cache_key) != request.user.id:
+            raise Http404
+
+        result = celery_app.AsyncResult(task_id)
+        if not result.ready():
+            return Response({"status": result.state}, status=202)
+
+        # Only the request removing the entry serves the file, concurrent
+        # requests for the same result get a 404
+        if not cache.delete(cache_key):
+            raise Http404
+        if not result.successful():
+            return HttpResponseServerError("Error creating bulk download")
+
+        path = Path(result.result)
+        try:
+            file = path.open("rb")
+        except FileNotFoundError:
+            # The entry is claimed already, the result cannot be collected again
+            raise Http404
+        # The download is one-off, the open handle keeps the file readable
+        path.unlink()
+        return FileResponse(
+            file,
+            as_attachment=True,
+            filename="documents.zip",
+            content_type="application/zip",
+        )
 
 
 class StoragePathViewSet(ModelViewSet, PermissionsAwareDocumentCountMixin):
@@ -1541,7 +1627,7 @@ class StoragePathViewSet(ModelViewSet, PermissionsAwareDocumentCountMixin):
         using it require a rename/move
         """
         instance = self.get_object()
-        doc_ids = [doc.id for doc in instance.documents.all()]
+        doc_ids = list(instance.documents.values_list("id", flat=True))
 
         # perform the deletion so renaming/moving can happen
         response = super().destroy(request, *args, **kwargs)
@@ -1580,7 +1666,7 @@ class UiSettingsView(GenericAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        user = User.objects.select_related("ui_settings").get(pk=request.user.id)
+        user = request.user
         ui_settings = {}
         if hasattr(user, "ui_settings"):
             ui_settings = user.ui_settings.settings
@@ -1629,7 +1715,9 @@ class UiSettingsView(GenericAPIView):
             user_resp["last_name"] = user.last_name
 
         # strip <app_label>.
-        roles = map(lambda perm: re.sub(r"^\w+.", "", perm), user.get_all_permissions())
+        roles = [
+            APP_LABEL_PREFIX_RE.sub("", perm) for perm in user.get_all_permissions()
+        ]
         return Response(
             {
                 "user": user_resp,
@@ -1651,36 +1739,52 @@ class UiSettingsView(GenericAPIView):
         )
 
 
+def _fetch_remote_version() -> str | None:
+    """
+    Returns the version of the latest release on GitHub, or None if it could not
+    be determined
+    """
+    try:
+        req = urllib.request.Request(REMOTE_VERSION_URL)
+        # Ensure a JSON response
+        req.add_header("Accept", "application/json")
+
+        with urllib.request.urlopen(req, timeout=5) as response:
+            remote = response.read().decode("utf8")
+        try:
+            remote_json = json.loads(remote)
+            # Some early tags used ngx-x.y.z
+            return remote_json["tag_name"].removeprefix("ngx-")
+        except ValueError:
+            logger.debug("An error occurred parsing remote version json")
+    except OSError:
+        # URLError, but also timeouts while reading the response
+        logger.debug("An error occurred checking for available updates")
+    return None
+
+
 class RemoteVersionView(GenericAPIView):
     def get(self, request, format=None):
-        remote_version = "0.0.0"
-        is_greater_than_current = False
-        current_version = packaging_version.parse(version.__full_version_str__)
-        try:
-            req = urllib.request.Request(
-                "https://api.github.com/repos/paperless-ngx/"
-                "paperless-ngx/releases/latest",
+        if settings.ENABLE_UPDATE_CHECK is False:
+            return Response(
+                {
+                    "version": version.__full_version_str__,
+                    "update_available": False,
+                },
             )
-            # Ensure a JSON response
-            req.add_header("Accept", "application/json")
 
-            with urllib.request.urlopen(req) as response:
-                remote = response.read().decode("utf8")
-            try:
-                remote_json = json.loads(remote)
-                remote_version = remote_json["tag_name"]
-                # Some early tags used ngx-x.y.z
-                remote_version = remote_version.removeprefix("ngx-")
-            except ValueError:
-                logger.debug("An error occurred parsing remote version json")
-        except urllib.error.URLError:
-            logger.debug("An error occurred checking for available updates")
+        remote_version = cache.get(REMOTE_VERSION_KEY)
+        if remote_version is None:
+            remote_version = _fetch_remote_version()
+            if remote_version is not None:
+                cache.set(REMOTE_VERSION_KEY, remote_version, CACHE_50_MINUTES)
+            else:
+                # Retry sooner, but not on every request while GitHub is unreachable
+                remote_version = "0.0.0"
+                cache.set(REMOTE_VERSION_KEY, remote_version, CACHE_5_MINUTES)
 
         is_greater_than_current = (
-            packaging_version.parse(
-                remote_version,
-            )
-            > current_version
+            packaging_version.parse(remote_version) > CURRENT_VERSION
         )
 
         return Response(
@@ -1696,17 +1800,12 @@ class TasksViewSet(ReadOnlyModelViewSet):
     serializer_class = TasksViewSerializer
 
     def get_queryset(self):
-        queryset = (
-            PaperlessTask.objects.filter(
-                acknowledged=False,
-            )
-            .order_by("date_created")
-            .reverse()
-        )
         task_id = self.request.query_params.get("task_id")
         if task_id is not None:
             queryset = PaperlessTask.objects.filter(task_id=task_id)
-        return queryset
+        else:
+            queryset = PaperlessTask.objects.filter(acknowledged=False)
+        return queryset.order_by("-date_created")
 
 
 class AcknowledgeTasksView(GenericAPIView):
@@ -1719,13 +1818,10 @@ class AcknowledgeTasksView(GenericAPIView):
 
         tasks = serializer.validated_data.get("tasks")
 
-        try:
-            result = PaperlessTask.objects.filter(id__in=tasks).update(
-                acknowledged=True,
-            )
-            return Response({"result": result})
-        except Exception:
-            return HttpResponseBadRequest()
+        result = PaperlessTask.objects.filter(id__in=tasks).update(
+            acknowledged=True,
+        )
+        return Response({"result": result})
 
 
 class ShareLinkViewSet(ModelViewSet, PassUserMixin):
@@ -1762,6 +1858,24 @@ class SharedLinkView(View):
         )
 
 
+@lru_cache(maxsize=1024)
+def _get_disposition_filenames(filename: str) -> tuple[bytes, str]:
+    """
+    Returns the ASCII fallback and the RFC 5987 encoded form of a filename
+    for the Content-Disposition header
+    """
+    # Firefox is not able to handle unicode characters in filename field
+    # RFC 5987 addresses this issue
+    # see https://datatracker.ietf.org/doc/html/rfc5987#section-4.2
+    # Chromium cannot handle commas in the filename
+    filename_normalized = normalize("NFKD", filename.replace(",", "_")).encode(
+        "ascii",
+        "ignore",
+    )
+    filename_encoded = quote(filename)
+    return filename_normalized, filename_encoded
+
+
 def serve_file(doc: Document, use_archive: bool, disposition: str):
     if use_archive:
         file_handle = doc.archive_file
@@ -1776,18 +1890,14 @@ def serve_file(doc: Document, use_archive: bool, disposition: str):
             mime_type = "text/plain"
 
     if doc.storage_type == Document.STORAGE_TYPE_GPG:
-        file_handle = GnuPG.decrypted(file_handle)
-
-    response = HttpResponse(file_handle, content_type=mime_type)
-    # Firefox is not able to handle unicode characters in filename field
-    # RFC 5987 addresses this issue
-    # see https://datatracker.ietf.org/doc/html/rfc5987#section-4.2
-    # Chromium cannot handle commas in the filename
-    filename_normalized = normalize("NFKD", filename.replace(",", "_")).encode(
-        "ascii",
-        "ignore",
-    )
-    filename_encoded = quote(filename)
+        # Decrypted content is already in memory, there is nothing to stream
+        response = HttpResponse(
+            GnuPG.decrypted(file_handle),
+            content_type=mime_type,
+        )
+    else:
+        response = FileResponse(file_handle, content_type=mime_type)
+    filename_normalized, filename_encoded = _get_disposition_filenames(filename)
     content_disposition = (
         f"{disposition}; "
         f'filename="{filename_normalized}"; '
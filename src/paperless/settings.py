@@ -216,6 +216,17 @@ def _parse_beat_schedule() -> dict:
                 "expires": 23.0 * 60.0 * 60.0,
             },
         },
+        {
+            "name": "Clean up bulk downloads",
+            "env_key": "PAPERLESS_BULK_DOWNLOAD_CLEANUP_TASK_CRON",
+            # Default hourly at 15 minutes past the hour
+            "env_default": "15 */1 * * *",
+            "task": "documents.tasks.cleanup_bulk_downloads",
+            "options": {
+                # 1 minute before default schedule sends again
+                "expires": 59.0 * 60.0,
+            },
+        },
     ]
     for task in tasks:
         # Either get the environment setting or use the default
@@ -15,6 +15,7 @@ from rest_framework.authtoken import views
 from rest_framework.routers import DefaultRouter
 
 from documents.views import AcknowledgeTasksView
+from documents.views import BulkDownloadResultView
 from documents.views import BulkDownloadView
 from documents.views import BulkEditObjectsView
 from documents.views import BulkEditView
@@ -116,6 +117,11 @@ urlpatterns = [
                     SelectionDataView.as_view(),
                     name="selection_data",
                 ),
+                path(
+                    "documents/bulk_download/<str:task_id>/",
+                    BulkDownloadResultView.as_view(),
+                    name="bulk_download_result",
+                ),
                 re_path(
                     "^documents/bulk_download/",
                     BulkDownloadView.as_view(),
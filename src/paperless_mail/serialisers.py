@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from documents.serialisers import CorrespondentField
 from documents.serialisers import DocumentTypeField
+from documents.serialisers import OwnedObjectListSerializer
 from documents.serialisers import OwnedObjectSerializer
 from documents.serialisers import TagsField
 from paperless_mail.models import MailAccount
@@ -42,6 +43,7 @@ class MailAccountSerializer(OwnedObjectSerializer):
             "account_type",
             "expiration",
         ]
+        list_serializer_class = OwnedObjectListSerializer
 
     def update(self, instance, validated_data):
         if (
@@ -101,6 +103,7 @@ class MailRuleSerializer(OwnedObjectSerializer):
             "permissions",
             "set_permissions",
         ]
+        list_serializer_class = OwnedObjectListSerializer
 
     def update(self, instance, validated_data):
         super().update(instance, validated_data)